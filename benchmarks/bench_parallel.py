@@ -0,0 +1,44 @@
+"""
+Speedup of export_suggestions_epargne with a process pool.
+
+Generates --rows synthetic clients and times the export with 1 worker
+and with --workers workers.
+
+    python -m benchmarks.bench_parallel --rows 1000000 --workers 32
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.data import ecrire_donnees
+from src.account_module.core import export_suggestions_epargne
+
+
+def chrono(fichier_personnes: str, fichier_epargnes: str, fichier_sortie: str, chunksize: int, workers: int) -> float:
+    debut = time.perf_counter()
+    export_suggestions_epargne(fichier_personnes, fichier_epargnes, fichier_sortie,
+                               chunksize=chunksize, workers=workers)
+    return time.perf_counter() - debut
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--chunksize', type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        personnes, epargnes = ecrire_donnees(tmp, args.rows)
+        serie = chrono(personnes, epargnes, os.path.join(tmp, 'serie.csv'), args.chunksize, 1)
+        parallele = chrono(personnes, epargnes, os.path.join(tmp, 'parallele.csv'), args.chunksize, args.workers)
+
+    print(f"{args.rows} clients, chunksize {args.chunksize}")
+    print(f"  1 worker   : {serie:.2f} s")
+    print(f"  {args.workers} workers : {parallele:.2f} s")
+    print(f"  speedup    : {serie / parallele:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Startup time of the account module, measured in fresh interpreters.
+
+Each scenario runs --runs times in a new `python -X importtime` process;
+the median wall time of the process and the cumulative import time of its
+heaviest modules are reported, along with whether pandas got imported.
+The scalar path (models, core, compound interest) must not import pandas.
+
+    python -m benchmarks.bench_startup --runs 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    'import core': "import src.account_module.core",
+    'suggestion scalaire': """
+from src.account_module.core import suggestion_epargne
+from src.account_module.models.epargne import Epargne
+from src.account_module.models.personne import Personne
+personne = Personne('Alice', 30, 42000.0, 900.0, 1200.0, 20000.0, 10, 200.0)
+suggestion_epargne(personne, [Epargne('Livret A', 0.03, 0.0, 1, 22950.0)])
+""",
+    'import core + pandas': "import src.account_module.core\nimport pandas",
+}
+# Appended to every scenario: tells whether pandas was loaded
+SONDE = "\nimport sys\nprint('pandas' in sys.modules)"
+
+
+def lancer(code: str):
+    """
+    Run code in a fresh interpreter; returns the wall time, whether pandas
+    was imported and the cumulative import time (µs) of each module.
+    """
+    debut = time.perf_counter()
+    sortie = subprocess.run([sys.executable, '-X', 'importtime', '-c', code + SONDE],
+                            cwd=RACINE, capture_output=True, text=True, check=True)
+    duree = time.perf_counter() - debut
+    imports = {}
+    for ligne in sortie.stderr.splitlines():
+        if not ligne.startswith('import time:') or 'cumulative' in ligne:
+            continue
+        _, cumul, module = ligne[len('import time:'):].split('|')
+        imports[module.strip()] = int(cumul)
+    return duree, sortie.stdout.strip().splitlines()[-1] == 'True', imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=5, help="Heaviest top-level imports shown")
+    args = parser.parse_args()
+
+    for nom, code in SCENARIOS.items():
+        mesures = [lancer(code) for _ in range(args.runs)]
+        duree = statistics.median(m[0] for m in mesures)
+        pandas_charge = mesures[-1][1]
+        imports = mesures[-1][2]
+        print(f"{nom}: {duree * 1000:.0f} ms (médiane de {args.runs}), pandas importé: {'oui' if pandas_charge else 'non'}")
+        racines = {module: cumul for module, cumul in imports.items() if '.' not in module}
+        for module, cumul in sorted(racines.items(), key=lambda m: -m[1])[:args.top]:
+            print(f"  {module:<12} {cumul / 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
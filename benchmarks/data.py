@@ -0,0 +1,56 @@
+"""
+Synthetic persons and products files for the benchmarks.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'src', 'account_module', 'data')
+
+
+def generer_personnes(lignes: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Random clients with the columns and value ranges of data/personnes.csv.
+    """
+    rng = np.random.default_rng(seed)
+    revenu = rng.integers(15_000, 120_000, lignes)
+    versement = np.round(rng.uniform(0, 1_500, lignes), 0)
+    versement[rng.random(lignes) < 0.1] = np.nan
+    return pd.DataFrame({
+        'nom': 'Client_' + pd.RangeIndex(lignes).astype(str),
+        'age': rng.integers(18, 70, lignes),
+        'revenu_annuel': revenu,
+        'loyer': rng.integers(300, 2_000, lignes),
+        'depenses_mensuelles': rng.integers(200, 1_500, lignes),
+        'versement_mensuel_utilisateur': versement,
+        'objectif': np.round(rng.uniform(5_000, 300_000, lignes), -3),
+        'duree_epargne': rng.integers(1, 41, lignes),
+    })
+
+
+def generer_epargnes(produits: int = 12, seed: int = 0) -> pd.DataFrame:
+    """
+    The sample catalogue, extended with rate/cap variants up to `produits` rows.
+    """
+    base = pd.read_csv(os.path.join(DATA_DIR, 'epargnes.csv'))
+    if produits <= len(base):
+        return base.head(produits)
+    rng = np.random.default_rng(seed)
+    variantes = base.iloc[rng.integers(0, len(base), produits - len(base))].reset_index(drop=True)
+    variantes['nom'] = variantes['nom'] + ' v' + variantes.index.astype(str)
+    variantes['taux_interet'] = np.round(variantes['taux_interet'] * rng.uniform(0.8, 1.2, len(variantes)), 4)
+    variantes['versement_max'] = variantes['versement_max'].replace('None', np.nan).astype(float)
+    variantes['versement_max'] = np.round(variantes['versement_max'] * rng.uniform(0.5, 1.5, len(variantes)), 0)
+    return pd.concat([base, variantes], ignore_index=True)
+
+
+def ecrire_donnees(dossier: str, lignes: int, produits: int = 12, seed: int = 0):
+    """
+    Write personnes.csv and epargnes.csv into dossier; returns both paths.
+    """
+    personnes = os.path.join(dossier, 'personnes.csv')
+    epargnes = os.path.join(dossier, 'epargnes.csv')
+    generer_personnes(lignes, seed).to_csv(personnes, index=False)
+    generer_epargnes(produits, seed).to_csv(epargnes, index=False)
+    return personnes, epargnes
@@ -0,0 +1,108 @@
+"""
+Stage-by-stage benchmark of the suggestion workflow.
+
+Generates synthetic clients at each requested size and times import,
+cleaning, suggestion, result export to DataFrame and the full streaming
+export separately, reporting throughput and peak traced memory.
+
+    python -m benchmarks.run --sizes 1000 100000 1000000
+
+Per-object stages (import_personnes, suggestion_epargne, per-row
+to_dataframe) are run on at most --scalar-limit clients.
+"""
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+from benchmarks.data import ecrire_donnees
+from src.account_module import utils
+from src.account_module.core import (
+    PERSONNE_FLOAT_COLS, PERSONNE_INT_COLS, export_suggestions_epargne, import_epargnes,
+    import_epargnes_dataframe, import_personnes, import_personnes_dataframe, suggestion_epargne,
+    suggestion_epargne_resultats,
+)
+
+
+def mesurer(etape: str, lignes: int, fonction: Callable[[], object]) -> Dict[str, object]:
+    """
+    Time one call of fonction, then measure its peak memory in a second traced call.
+    """
+    debut = time.perf_counter()
+    fonction()
+    duree = time.perf_counter() - debut
+    tracemalloc.start()
+    fonction()
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'etape': etape,
+        'lignes': lignes,
+        'secondes': duree,
+        'lignes_par_seconde': lignes / duree if duree > 0 else float('inf'),
+        'pic_memoire_mo': pic / 2**20,
+    }
+
+
+def benchmark_taille(dossier: str, lignes: int, produits: int, limite_scalaire: int) -> List[Dict[str, object]]:
+    fichier_personnes, fichier_epargnes = ecrire_donnees(dossier, lignes, produits)
+    echantillon = os.path.join(dossier, 'echantillon.csv')
+    pd.read_csv(fichier_personnes, nrows=limite_scalaire).to_csv(echantillon, index=False)
+    n_echantillon = min(lignes, limite_scalaire)
+
+    brut = utils.read_dataframe(fichier_personnes)
+    personnes_df = import_personnes_dataframe(fichier_personnes)
+    epargnes_df = import_epargnes_dataframe(fichier_epargnes)
+    personnes = import_personnes(echantillon)
+    epargnes = import_epargnes(fichier_epargnes)
+    resultats_objets = [r for p in personnes for r in suggestion_epargne(p, epargnes)]
+    resultats = suggestion_epargne_resultats(personnes_df, epargnes_df)
+    sortie = os.path.join(dossier, 'suggestions.csv')
+
+    return [
+        mesurer('import_personnes', n_echantillon, lambda: import_personnes(echantillon)),
+        mesurer('read_dataframe', lignes, lambda: utils.read_dataframe(fichier_personnes)),
+        mesurer('clean_dataframe', lignes, lambda: utils.clean_dataframe(
+            brut, float_cols=PERSONNE_FLOAT_COLS, int_cols=PERSONNE_INT_COLS)),
+        mesurer('suggestion_epargne', n_echantillon, lambda: [suggestion_epargne(p, epargnes) for p in personnes]),
+        mesurer('suggestion_epargne_resultats', lignes, lambda: suggestion_epargne_resultats(personnes_df, epargnes_df)),
+        mesurer('ResultatEpargne.to_dataframe', len(resultats_objets),
+                lambda: pd.concat([r.to_dataframe() for r in resultats_objets], ignore_index=True)),
+        mesurer('ResultatsEpargne.to_dataframe', len(resultats), resultats.to_dataframe),
+        mesurer('export_suggestions_epargne', lignes,
+                lambda: export_suggestions_epargne(fichier_personnes, fichier_epargnes, sortie)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000])
+    parser.add_argument('--produits', type=int, default=12)
+    parser.add_argument('--scalar-limit', type=int, default=1_000)
+    parser.add_argument('--json', help="Write the measures to this JSON file")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    mesures = []
+    for lignes in args.sizes:
+        with tempfile.TemporaryDirectory() as dossier:
+            for mesure in benchmark_taille(dossier, lignes, args.produits, args.scalar_limit):
+                mesure['taille'] = lignes
+                mesures.append(mesure)
+                print(f"{lignes:>9} | {mesure['etape']:<30} | {mesure['lignes']:>10} lignes | "
+                      f"{mesure['secondes']:8.3f} s | {mesure['lignes_par_seconde']:>12,.0f} l/s | "
+                      f"{mesure['pic_memoire_mo']:8.1f} Mo")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(mesures, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
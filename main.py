@@ -1,10 +1,11 @@
-import pandas as pd
+import logging
 
 from src.account_module.core import import_personnes, import_epargnes, save_personnes, save_epargnes
 from src.account_module.models.epargne import Epargne
 from src.account_module.models.personne import Personne
 from src.account_module.utils import calcul_interets_composes
-from src.account_module.core import suggestion_epargne_with_decorator
+from src.account_module.core import export_suggestions_epargne
+from src.account_module.instrumentation import session_instrumentee
 
 def main():
     # Création d'un objet Epargne
@@ -57,31 +58,22 @@ def main():
     except Exception as e:
         print(f"An error occurred: {e}")
 
-    # Suggestion d'épargne
+    # Suggestion d'épargne, exportée au fil de l'eau par paquets de personnes :
+    # les 3 meilleurs produits de chaque client par gain net
     try:
-        cleaned_personnes = import_personnes('cleaned_personnes.csv')
-        if not cleaned_personnes:
-            raise ValueError("Aucune personne trouvée dans le fichier nettoyé.")
-
-        cleaned_epargnes = import_epargnes('cleaned_epargnes.csv')
-        if not cleaned_epargnes:
-            raise ValueError("Aucun produit d'épargne trouvé dans le fichier nettoyé.")
-
-        suggestions = []
-        for personne in cleaned_personnes:
-            suggestions.extend(suggestion_epargne_with_decorator(personne, cleaned_epargnes))
-            if not suggestions:
-                print("Aucune suggestion d'épargne disponible.")
-            else:
-                for suggestion in suggestions:
-                    suggestion.afficher()
-
-        # Export des suggestions en DataFrame
-        suggestions_df = pd.concat([s.to_dataframe() for s in suggestions], ignore_index=True)
-        suggestions_df.to_csv('suggestions_epargne.csv', index=False)
+        lignes = export_suggestions_epargne('cleaned_personnes.csv', 'cleaned_epargnes.csv', 'suggestions_epargne.csv',
+                                            top_k=3, critere='gain_net')
+        if lignes == 0:
+            print("Aucune suggestion d'épargne disponible.")
+        else:
+            print(f"{lignes} suggestions d'épargne exportées dans suggestions_epargne.csv")
 
     except Exception as e:
         print(f"An error occurred during the savings suggestion: {e}")
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    # ACCOUNT_MODULE_METRICS=metrics.json dumps the run metrics,
+    # ACCOUNT_MODULE_PROFILE=cprofile|tracemalloc profiles the run
+    with session_instrumentee():
+        main()
@@ -0,0 +1,96 @@
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+import src.account_module.utils as utils
+from src.account_module.core import eligibilite_produits
+from src.account_module.models.epargne import Epargne
+from src.account_module.models.personne import Personne
+from src.account_module.models.tables import EpargneTable, PersonneTable
+
+
+def allocation_epargne(personnes_df: Union[pd.DataFrame, PersonneTable, List[Personne]],
+                       epargnes_df: Union[pd.DataFrame, EpargneTable, List[Epargne]],
+                       table: Optional[utils.TableFacteurs] = None) -> pd.DataFrame:
+    """
+    Split each client's monthly savings capacity across several products.
+
+    Products meeting duree_min are filled in decreasing order of net yield
+    (net final amount per 1 € of monthly deposit, after fiscalite), each up
+    to its cap (versement_max total deposits over the duration, none when
+    missing), until the capacity is used or the objectif is reached; the
+    last product used only gets what the objectif still needs.
+
+    The greedy fill runs on the whole clients x products matrix at once:
+    with products sorted per client, deposits follow from cumulative sums
+    of the caps (capacity) and of the net amounts (objectif), without a
+    loop over clients.
+
+    Returns one row per (client, product used), in client then rank order,
+    with the monthly deposit, total deposits, net final amount, whether the
+    product cap is reached and whether the client's whole plan reaches the
+    objectif.
+    """
+    personnes = PersonneTable.coerce(personnes_df)
+    epargnes = EpargneTable.coerce(epargnes_df)
+    n_clients, n_produits = len(personnes), len(epargnes)
+
+    duree = personnes.duree_epargne
+    duree_max = int(duree.max()) if n_clients else 0
+    if table is None:
+        table = utils.TableFacteurs(epargnes.taux_interet, duree_max)
+    else:
+        table.etendre(duree_max)
+
+    # Net amount per 1 € of monthly deposit (C, P), as in solveur.facteur_net
+    duree_cp = np.broadcast_to(duree[:, None], (n_clients, n_produits))
+    facteur = table.facteurs(np.broadcast_to(epargnes.taux_interet, (n_clients, n_produits)).ravel(),
+                             duree_cp.ravel()).reshape(n_clients, n_produits)
+    coefficient = 12 * (duree_cp + (facteur - duree_cp) * (1 - epargnes.fiscalite))
+    duree_ok, _ = eligibilite_produits(personnes, epargnes)
+    coefficient = np.where(duree_ok & (coefficient > 0), coefficient, 0.0)
+
+    # Monthly cap of each product (C, P); a missing versement_max is no cap
+    plafond = np.divide(epargnes.versement_max, 12 * duree_cp,
+                        out=np.zeros((n_clients, n_produits)), where=duree_cp > 0)
+    plafond = np.where(np.isnan(epargnes.versement_max), np.inf, plafond)
+    plafond = np.where(coefficient > 0, plafond, 0.0)
+
+    # Products by decreasing net yield, catalogue order on ties
+    ordre = np.argsort(-coefficient, axis=1, kind='stable')
+    coefficient = np.take_along_axis(coefficient, ordre, axis=1)
+    plafond = np.take_along_axis(plafond, ordre, axis=1)
+
+    # Fill up to the capacity: each product gets what is left after the better ones
+    capacite = np.maximum(personnes.calcul_capacite_epargne(), 0)
+    avant = np.zeros_like(plafond)
+    np.cumsum(plafond[:, :-1], axis=1, out=avant[:, 1:])
+    versement = np.clip(capacite[:, None] - avant, 0, plafond)
+
+    # Stop at the objectif: trim the product that crosses it, drop the next ones
+    objectif = personnes.objectif
+    cumul = np.cumsum(versement * coefficient, axis=1)
+    depasse = cumul - objectif[:, None]
+    reste = np.divide(depasse, coefficient, out=np.zeros_like(depasse), where=coefficient > 0)
+    versement = np.clip(versement - np.clip(reste, 0, None), 0, None)
+    versement = np.where(objectif[:, None] > 0, versement, 0.0)
+
+    montant_net = versement * coefficient
+    atteint = montant_net.sum(axis=1) >= objectif * (1 - 1e-9)
+
+    ci, rang = np.nonzero(versement > 0)
+    pi = ordre[ci, rang]
+    x = versement[ci, rang]
+    return pd.DataFrame({
+        'nom_client': personnes.nom[ci],
+        'rang': rang + 1,
+        'nom_produit': epargnes.nom[pi],
+        'versement_mensuel': np.round(x, 2),
+        'total_versement': np.round(x * 12 * duree[ci], 2),
+        'montant_net_final': np.round(montant_net[ci, rang], 2),
+        'plafond_atteint': x >= plafond[ci, rang] * (1 - 1e-9),
+        'atteint_objectif': atteint[ci],
+        'taux_interet': epargnes.taux_interet[pi],
+        'fiscalite': epargnes.fiscalite[pi],
+    })
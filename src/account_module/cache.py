@@ -0,0 +1,96 @@
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from src.account_module.models.personne import Personne
+from src.account_module.models.epargne import Epargne
+
+# Personne fields that determine its suggestions (the name does not)
+CHAMPS_PROFIL = ('revenu_annuel', 'loyer', 'depenses_mensuelles', 'objectif',
+                 'duree_epargne', 'versement_mensuel_utilisateur')
+
+
+def empreinte_catalogue(epargnes: List[Epargne]) -> int:
+    """
+    Fingerprint of a product catalogue: changes whenever any product field changes.
+
+    An EpargneCatalogue carries its fingerprint, computed once when indexed.
+    """
+    empreinte = getattr(epargnes, 'empreinte', None)
+    if empreinte is not None:
+        return empreinte
+    return hash(tuple((e.nom, e.taux_interet, e.fiscalite, e.duree_min, e.versement_max) for e in epargnes))
+
+
+class SuggestionCache:
+    """
+    Bounded LRU cache of suggestion rows, keyed on a client's financial
+    profile plus the product catalogue fingerprint.
+
+    Clients sharing a profile (or differing only by name) reuse the rows
+    computed for the first one. Pass an instance to suggestion_epargne to
+    opt in.
+    """
+
+    def __init__(self, maxsize: int = 100_000):
+        if maxsize <= 0:
+            raise ValueError("La taille du cache doit être positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lignes: "OrderedDict[Hashable, Tuple]" = OrderedDict()
+
+    def cle(self, personne: Personne, epargnes: List[Epargne]) -> Tuple:
+        """
+        Cache key of a client against a catalogue.
+        """
+        return tuple(getattr(personne, champ) for champ in CHAMPS_PROFIL) + (empreinte_catalogue(epargnes),)
+
+    def get(self, cle: Hashable) -> Optional[Tuple]:
+        """
+        Cached rows for cle, or None; a hit marks the entry as most recently used.
+        """
+        lignes = self._lignes.get(cle)
+        if lignes is None:
+            self.misses += 1
+            return None
+        self._lignes.move_to_end(cle)
+        self.hits += 1
+        return lignes
+
+    def put(self, cle: Hashable, lignes: Tuple):
+        """
+        Store rows for cle, evicting the least recently used entry when full.
+        """
+        self._lignes[cle] = lignes
+        self._lignes.move_to_end(cle)
+        if len(self._lignes) > self.maxsize:
+            self._lignes.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._lignes.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._lignes)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss statistics of the cache.
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'evictions': self.evictions,
+            'size': len(self._lignes),
+            'maxsize': self.maxsize,
+        }
+
+    def log_stats(self):
+        s = self.stats()
+        logging.info(f"Cache suggestions: {s['hits']} hits, {s['misses']} misses "
+                     f"({s['hit_rate']:.1%}), {s['evictions']} evictions, {s['size']}/{s['maxsize']} entrées")
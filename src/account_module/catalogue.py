@@ -0,0 +1,49 @@
+import math
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List
+
+from src.account_module.cache import empreinte_catalogue
+from src.account_module.models.epargne import Epargne
+
+
+class EpargneCatalogue:
+    """
+    Product catalogue indexed for eligibility lookups.
+
+    Products keep their original order; two sorted views, by duree_min and
+    by versement_max, answer "which products are open to (duree, objectif)"
+    with two bisects and a scan of the smaller candidate set instead of a
+    full pass over the catalogue. The index is a snapshot: rebuild the
+    catalogue after modifying its products.
+    """
+
+    def __init__(self, epargnes: Iterable[Epargne]):
+        self.epargnes: List[Epargne] = list(epargnes)
+        # A missing cap (None -> inf, or NaN from a file) never excludes a product
+        self._plafonds = [math.inf if math.isnan(e.versement_max) else e.versement_max for e in self.epargnes]
+        self._par_duree = sorted(range(len(self.epargnes)), key=lambda i: self.epargnes[i].duree_min)
+        self._durees_triees = [self.epargnes[i].duree_min for i in self._par_duree]
+        self._par_plafond = sorted(range(len(self.epargnes)), key=lambda i: self._plafonds[i])
+        self._plafonds_tries = [self._plafonds[i] for i in self._par_plafond]
+        self.empreinte = empreinte_catalogue(self.epargnes)
+
+    def eligibles(self, duree_epargne: int, objectif: float) -> List[Epargne]:
+        """
+        Products whose duree_min is met and whose versement_max covers objectif,
+        in catalogue order.
+        """
+        # Products with duree_min <= duree_epargne form a prefix of the duration view,
+        # products with versement_max >= objectif a suffix of the cap view
+        fin_duree = bisect_right(self._durees_triees, duree_epargne)
+        debut_plafond = bisect_left(self._plafonds_tries, objectif)
+        if fin_duree <= len(self.epargnes) - debut_plafond:
+            indices = [i for i in self._par_duree[:fin_duree] if not objectif > self._plafonds[i]]
+        else:
+            indices = [i for i in self._par_plafond[debut_plafond:] if self.epargnes[i].duree_min <= duree_epargne]
+        return [self.epargnes[i] for i in sorted(indices)]
+
+    def __len__(self) -> int:
+        return len(self.epargnes)
+
+    def __iter__(self) -> Iterator[Epargne]:
+        return iter(self.epargnes)
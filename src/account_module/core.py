@@ -1,94 +1,260 @@
+from __future__ import annotations
+
+import heapq
 import os
-import pandas as pd
+from collections import Counter, deque
+import numpy as np
 import logging
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
 
 import src.account_module.utils as utils
+from src.account_module.cache import SuggestionCache
+from src.account_module.catalogue import EpargneCatalogue
+from src.account_module.instrumentation import metriques
 from src.account_module.models.personne import Personne
 from src.account_module.models.epargne import Epargne
-from src.account_module.models.resultat import ResultatEpargne
+from src.account_module.models.resultat import ResultatEpargne, ResultatsEpargne, score_classement
+from src.account_module.models.tables import PersonneTable, EpargneTable
+
+if TYPE_CHECKING:
+    # pandas is only imported by the file I/O paths, when they run
+    import pandas as pd
+    from src.account_module.montecarlo import SimulationMonteCarlo
+    from src.account_module.projection import ProjectionMensuelle
+
+# Typed columns of the persons and savings products files
+PERSONNE_FLOAT_COLS = ['revenu_annuel', 'loyer', 'depenses_mensuelles', 'objectif', 'versement_mensuel_utilisateur']
+PERSONNE_INT_COLS = ['age', 'duree_epargne']
+EPARGNE_FLOAT_COLS = ['taux_interet', 'fiscalite', 'versement_max', 'volatilite']
+EPARGNE_INT_COLS = ['duree_min']
+# Columns parsed from input files (others are skipped)
+PERSONNE_COLONNES = ['nom'] + PERSONNE_FLOAT_COLS + PERSONNE_INT_COLS
+EPARGNE_COLONNES = ['nom'] + EPARGNE_FLOAT_COLS + EPARGNE_INT_COLS
+# Columns without which a row is rejected
+PERSONNE_REQUIS = ['nom'] + PERSONNE_INT_COLS
+EPARGNE_REQUIS = ['nom'] + EPARGNE_INT_COLS
+
+# Share of the monthly savings capacity tried in each suggestion scenario
+SCENARIOS_CAPACITE = (0.25, 0.5, 0.75, 1.0)
+
+def _personnes_depuis_dataframe(df: pd.DataFrame) -> Iterator[Personne]:
+    """
+    Build Personne instances from a cleaned DataFrame, one per row.
+
+    Columns are already typed, so values are read column-wise as Python
+    ints and floats rather than converted row by row.
+    """
+    try:
+        colonnes = {
+            'nom': df['nom'].tolist(),
+            'age': df['age'].to_numpy(dtype=np.int64).tolist(),
+            'duree_epargne': df['duree_epargne'].to_numpy(dtype=np.int64).tolist()
+        }
+    except (TypeError, ValueError) as e:
+        logging.error("Valeur manquante pour age ou duree_epargne: %s", e)
+        raise
+    for col in ['revenu_annuel', 'loyer', 'depenses_mensuelles', 'objectif', 'versement_mensuel_utilisateur']:
+        if col in df.columns:
+            colonnes[col] = df[col].to_numpy(dtype=float, na_value=np.nan).tolist()
+        else:
+            colonnes[col] = [None] * len(df)
+    for valeurs in zip(*colonnes.values()):
+        yield Personne(**dict(zip(colonnes, valeurs)))
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def import_personnes(fichier: str) -> List[Personne]:
+def import_personnes_dataframe(fichier: str,
+                               cache: Optional[str] = None,
+                               rejets: Optional[str] = None) -> pd.DataFrame:
+    """
+    Import a file of persons as a cleaned DataFrame; only the
+    PERSONNE_COLONNES columns are parsed.
+
+    With cache (a .parquet or .feather path), the cleaned frame is reloaded
+    from that typed file as long as the source file is unchanged. With
+    rejets (a file path), invalid rows are written there with their reasons
+    instead of aborting the import.
+    """
+    if cache is not None:
+        return utils.read_cached_dataframe(fichier, cache, float_cols=PERSONNE_FLOAT_COLS, int_cols=PERSONNE_INT_COLS,
+                                           requis=PERSONNE_REQUIS, rejets=rejets)
+    df = utils.read_dataframe(fichier, colonnes=PERSONNE_COLONNES)
+    return utils.clean_dataframe(df, float_cols=PERSONNE_FLOAT_COLS, int_cols=PERSONNE_INT_COLS, copy=False,
+                                 requis=PERSONNE_REQUIS, rejets=rejets)
+
+
+@metriques.chronometre('import_personnes')
+def import_personnes(fichier: str, cache: Optional[str] = None, rejets: Optional[str] = None) -> List[Personne]:
     """
     Import a file of persons and return a list of Personne instances.
     """
-    df = utils.read_dataframe(fichier)
-    df = utils.clean_dataframe(df, float_cols=['revenu_annuel', 'loyer', 'depenses_mensuelles', 'objectif', 'versement_mensuel_utilisateur'], int_cols=['age', 'duree_epargne'])
-
-    personnes = []
-    for idx, row in df.iterrows():
-        try:
-            p = Personne(
-                nom=row['nom'],
-                age=int(row['age']),
-                revenu_annuel=float(row['revenu_annuel']),
-                loyer=float(row['loyer']),
-                depenses_mensuelles=float(row['depenses_mensuelles']),
-                objectif=float(row['objectif']),
-                duree_epargne=int(row['duree_epargne']),
-                versement_mensuel_utilisateur=float(row['versement_mensuel_utilisateur']) if 'versement_mensuel_utilisateur' in row else None
-            )
-            personnes.append(p)
-        except Exception as e:
-            logging.error(f"Erreur instanciation Personne à la ligne {idx}: {e}")
-            raise
-
-    logging.info(f"Import de {len(personnes)} personnes terminé.")
+    df = import_personnes_dataframe(fichier, cache=cache, rejets=rejets)
+
+    personnes = list(_personnes_depuis_dataframe(df))
+
+    metriques.incrementer('lignes_lues.personnes', len(personnes))
+    logging.info("Import de %d personnes terminé.", len(personnes))
     return personnes
 
 
-def import_epargnes(fichier: str) -> List[Epargne]:
+def iter_personnes(fichier: str,
+                   chunksize: int = 100_000,
+                   batches: bool = False,
+                   rejets: Optional[str] = None) -> Iterator[Union[Personne, pd.DataFrame]]:
+    """
+    Stream a file of persons chunk by chunk.
+
+    Each chunk is cleaned on its own, so memory stays bounded by chunksize
+    and consumers can start before the whole file is read. Yields Personne
+    instances, or the cleaned chunk DataFrames when batches is True (ready
+    for suggestion_epargne_batch). With rejets (a file path), invalid rows
+    of every chunk are appended there instead of aborting the stream.
+    """
+    total = 0
+    writer = utils.DataFrameWriter(rejets) if rejets is not None else None
+    try:
+        for chunk in utils.iter_dataframe(fichier, chunksize, colonnes=PERSONNE_COLONNES):
+            with metriques.chrono('clean_dataframe'):
+                chunk = utils.clean_dataframe(chunk, float_cols=PERSONNE_FLOAT_COLS, int_cols=PERSONNE_INT_COLS,
+                                              copy=False, requis=PERSONNE_REQUIS, rejets=writer)
+            metriques.incrementer('lignes_lues.personnes', len(chunk))
+            total += len(chunk)
+            if batches:
+                yield chunk
+            else:
+                yield from _personnes_depuis_dataframe(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    logging.info("Import de %d personnes terminé.", total)
+
+
+def _lire_personnes_source(fichier: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Read and validate one persons file of import_personnes_sources (in a
+    pool worker); both frames come back with their columns in
+    PERSONNE_COLONNES order.
+    """
+    df = utils.read_dataframe(fichier, colonnes=PERSONNE_COLONNES)
+    manquantes = [col for col in PERSONNE_REQUIS if col not in df.columns]
+    if manquantes:
+        raise ValueError(f"Colonnes manquantes dans {fichier}: {', '.join(manquantes)}")
+    valides, invalides = utils.valider_dataframe(df, float_cols=PERSONNE_FLOAT_COLS, int_cols=PERSONNE_INT_COLS,
+                                                 requis=PERSONNE_REQUIS, copy=False)
+    invalides = invalides.reindex(columns=['ligne'] + PERSONNE_COLONNES + ['motif'])
+    invalides.insert(0, 'fichier', fichier)
+    return valides.reindex(columns=PERSONNE_COLONNES), invalides
+
+
+@metriques.chronometre('import_personnes_sources')
+def import_personnes_sources(sources: Union[str, List[str]],
+                             workers: Optional[int] = None,
+                             cle: Tuple[str, ...] = ('nom',),
+                             rejets: Optional[str] = None) -> pd.DataFrame:
+    """
+    Import every persons file of sources (a directory, a glob pattern, a
+    file or a list of them, see utils.lister_fichiers) as one cleaned
+    DataFrame.
+
+    Files are parsed concurrently, with at most workers files at a time
+    per pool: CSV, TXT and the pyarrow formats in a thread pool (their
+    parsers release the GIL), Excel workbooks in a process pool (openpyxl
+    parses in pure Python). Columns are put in PERSONNE_COLONNES order
+    whatever their order in each file, and clients are deduplicated on
+    cle, the row of the last file in path order winning. With rejets (a
+    file path), invalid rows of every file are written there with their
+    file, line and reason instead of aborting the import.
+    """
+    import pandas as pd
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    fichiers = utils.lister_fichiers(sources)
+    excel = [f for f in fichiers if os.path.splitext(f)[1].lower() in ('.xlsx', '.xls')]
+    texte = [f for f in fichiers if f not in excel]
+    futures = {}
+    # Worker processes are started before any reader thread, so they are
+    # never forked from a multi-threaded process
+    with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, max(len(excel), 1))) as processus:
+        futures.update((f, processus.submit(_lire_personnes_source, f)) for f in excel)
+        with ThreadPoolExecutor(max_workers=workers) as fils:
+            futures.update((f, fils.submit(_lire_personnes_source, f)) for f in texte)
+            lus = [futures[f].result() for f in fichiers]
+
+    invalides = pd.concat([i for _, i in lus if len(i)] or [lus[0][1]], ignore_index=True)
+    if len(invalides) and rejets is None:
+        fichier, ligne, motif = invalides[['fichier', 'ligne', 'motif']].iloc[0]
+        logging.error("%d lignes invalides, la première (%s, ligne %s): %s", len(invalides), fichier, ligne, motif)
+        raise ValueError(f"Format invalide dans {fichier} à la ligne {ligne}: {motif}")
+    if rejets is not None:
+        utils.write_dataframe(invalides, rejets)
+    if len(invalides):
+        metriques.incrementer('lignes_rejetees', len(invalides))
+        logging.warning("%d lignes invalides écartées", len(invalides))
+
+    df = pd.concat([v for v, _ in lus], ignore_index=True)
+    doublons = df.duplicated(subset=list(cle), keep='last')
+    if doublons.any():
+        df = df[~doublons].reset_index(drop=True)
+        metriques.incrementer('doublons.personnes', int(doublons.sum()))
+        logging.info("%d doublons de personnes écartés (clé %s)", int(doublons.sum()), ', '.join(cle))
+    metriques.incrementer('lignes_lues.personnes', len(df))
+    logging.info("Import de %d personnes depuis %d fichiers terminé.", len(df), len(fichiers))
+    return df
+
+
+def import_epargnes_dataframe(fichier: str,
+                              cache: Optional[str] = None,
+                              rejets: Optional[str] = None) -> pd.DataFrame:
+    """
+    Import a file of savings products as a cleaned DataFrame; only the
+    EPARGNE_COLONNES columns are parsed.
+
+    With cache (a .parquet or .feather path), the cleaned frame is reloaded
+    from that typed file as long as the source file is unchanged. With
+    rejets (a file path), invalid rows are written there with their reasons
+    instead of aborting the import.
+    """
+    if cache is not None:
+        return utils.read_cached_dataframe(fichier, cache, float_cols=EPARGNE_FLOAT_COLS, int_cols=EPARGNE_INT_COLS,
+                                           requis=EPARGNE_REQUIS, rejets=rejets)
+    df = utils.read_dataframe(fichier, colonnes=EPARGNE_COLONNES)
+    return utils.clean_dataframe(df, float_cols=EPARGNE_FLOAT_COLS, int_cols=EPARGNE_INT_COLS, copy=False,
+                                 requis=EPARGNE_REQUIS, rejets=rejets)
+
+
+@metriques.chronometre('import_epargnes')
+def import_epargnes(fichier: str, cache: Optional[str] = None, rejets: Optional[str] = None) -> List[Epargne]:
     """
     Import a file of savings products and return a list of Epargne instances.
     """
-    df = utils.read_dataframe(fichier)
-    df = utils.clean_dataframe(
-        df,
-        float_cols=['taux_interet', 'fiscalite', 'versement_max'],
-        int_cols=['duree_min']
-    )
+    df = import_epargnes_dataframe(fichier, cache=cache, rejets=rejets)
 
-    epargnes = []
-    for idx, row in df.iterrows():
-        try:
-            e = Epargne(
-                nom=row['nom'],
-                taux_interet=float(row['taux_interet']),
-                fiscalite=float(row['fiscalite']),
-                versement_max=float(row['versement_max']),
-                duree_min=int(row['duree_min'])
-            )
-            epargnes.append(e)
-        except Exception as e:
-            logging.error(f"Erreur instanciation Epargne à la ligne {idx}: {e}")
-            raise
-
-    logging.info(f"Import de {len(epargnes)} produits d'épargne terminé.")
+    epargnes = list(EpargneTable.from_dataframe(df))
+
+    metriques.incrementer('lignes_lues.epargnes', len(epargnes))
+    logging.info("Import de %d produits d'épargne terminé.", len(epargnes))
     return epargnes
 
-def save_personnes(personnes: List[Personne], fichier: str):
+def save_personnes(personnes: Union[List[Personne], PersonneTable], fichier: str):
     """
-    Save a list of Personne instances to a file.
+    Save a list of Personne instances, or a PersonneTable, to a file.
     """
-    # Conversion en DataFrame via dict
-    data = [p.__dict__ for p in personnes]
-    df = pd.DataFrame(data)
-    utils.write_dataframe(df, fichier)
+    if not isinstance(personnes, PersonneTable):
+        personnes = PersonneTable.from_personnes(personnes)
+    utils.write_dataframe(personnes.to_dataframe(), fichier)
 
 
-def save_epargnes(epargnes: List[Epargne], fichier: str):
+def save_epargnes(epargnes: Union[List[Epargne], EpargneTable], fichier: str):
     """
-    Save a list of Epargne instances to a file.
+    Save a list of Epargne instances, or an EpargneTable, to a file.
     """
-    data = [e.__dict__ for e in epargnes]
-    df = pd.DataFrame(data)
-    utils.write_dataframe(df, fichier)
+    if not isinstance(epargnes, EpargneTable):
+        epargnes = EpargneTable.from_epargnes(epargnes)
+    utils.write_dataframe(epargnes.to_dataframe(), fichier)
 
 def suggestion_epargne(personne: Personne,
-                        epargnes: List[Epargne]) -> List[ResultatEpargne]:
+                        epargnes: Union[List[Epargne], EpargneCatalogue],
+                        cache: Optional[SuggestionCache] = None,
+                        monte_carlo: Optional[SimulationMonteCarlo] = None) -> List[ResultatEpargne]:
     """
     Generates savings plan suggestions for each product,
     calculating gross and net amounts over the specified duration.
@@ -99,7 +265,21 @@ def suggestion_epargne(personne: Personne,
 
     Only products meeting the minimum duration are considered,
     and annual deposits exceeding the product's cap are skipped.
+    An EpargneCatalogue finds those products by bisection instead of a scan.
+
+    With a SuggestionCache, clients whose financial profile was already
+    computed against the same catalogue reuse the cached rows. With a
+    SimulationMonteCarlo of the catalogue, each result's indicateurs also
+    get percentiles of the net amount and the probability of reaching
+    the objective.
     """
+    if cache is not None:
+        cle = cache.cle(personne, epargnes)
+        lignes = cache.get(cle)
+        if lignes is not None:
+            resultats = [ResultatEpargne(personne.nom, *ligne[:-1], indicateurs=dict(ligne[-1])) for ligne in lignes]
+            return _ajouter_monte_carlo(resultats, personne, epargnes, monte_carlo)
+
     resultats: List[ResultatEpargne] = []
     capacite_mensuelle = personne.calcul_capacite_epargne()
 
@@ -107,20 +287,33 @@ def suggestion_epargne(personne: Personne,
     scenarios = []
     if personne.versement_mensuel_utilisateur and personne.versement_mensuel_utilisateur > 0:
         scenarios.append(personne.versement_mensuel_utilisateur)
-    for pct in (0.25, 0.5, 0.75, 1.0):
+    for pct in SCENARIOS_CAPACITE:
         scenarios.append(capacite_mensuelle * pct)
 
-    for e in epargnes:
-        # Check minimum duration requirement
-        if personne.duree_epargne < e.duree_min:
-            logging.debug(f"Skipping {e.nom}: minimum duration not met")
-            continue
-        for vm in scenarios:
-            versement_annuel = vm * 12
-            # Check objective and cap
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+    if isinstance(epargnes, EpargneCatalogue):
+        eligibles = epargnes.eligibles(personne.duree_epargne, personne.objectif)
+        metriques.incrementer('produits_ignores.non_eligible', len(epargnes) - len(eligibles))
+    else:
+        eligibles = []
+        for e in epargnes:
+            # Check minimum duration requirement
+            if personne.duree_epargne < e.duree_min:
+                metriques.incrementer('produits_ignores.duree_min')
+                if debug:
+                    logging.debug("Skipping %s: minimum duration not met", e.nom)
+                continue
+            # Check objective and cap (independent of the scenario)
             if personne.objectif > e.versement_max:
-                logging.debug(f"Skipping {e.nom}: objective exceeds maximum deposit")
+                metriques.incrementer('produits_ignores.versement_max')
+                if debug:
+                    logging.debug("Skipping %s: objective exceeds maximum deposit", e.nom)
                 continue
+            eligibles.append(e)
+
+    for e in eligibles:
+        for vm in scenarios:
+            versement_annuel = vm * 12
             # Calculate gross amount
             montant_brut = utils.calcul_interets_composes(versement_annuel, e.taux_interet, personne.duree_epargne)
             total_versement = versement_annuel * personne.duree_epargne
@@ -143,18 +336,384 @@ def suggestion_epargne(personne: Personne,
                 }
             ))
 
-    logging.info(f"Generated {len(resultats)} savings scenarios successfully.")
+    metriques.incrementer('scenarios_generes', len(resultats))
+    if debug:
+        logging.debug("Generated %d savings scenarios successfully.", len(resultats))
+    if cache is not None:
+        cache.put(cle, tuple((r.scenarios, r.nom_produit, r.effort_mensuel, r.total_versement,
+                              r.montant_net_final, r.atteint_objectif, dict(r.indicateurs)) for r in resultats))
+    return _ajouter_monte_carlo(resultats, personne, epargnes, monte_carlo)
+
+
+def _ajouter_monte_carlo(resultats: List[ResultatEpargne],
+                         personne: Personne,
+                         epargnes: Union[List[Epargne], EpargneCatalogue],
+                         monte_carlo: Optional[SimulationMonteCarlo]) -> List[ResultatEpargne]:
+    """
+    Add the Monte-Carlo indicators of each result, if a simulation is given.
+    """
+    if monte_carlo is None or not resultats:
+        return resultats
+    par_nom = {e.nom: e for e in epargnes}
+    for r in resultats:
+        r.indicateurs.update(monte_carlo.indicateurs_produit(
+            par_nom[r.nom_produit], r.effort_mensuel, personne.duree_epargne, personne.objectif))
+    return resultats
+
+def meilleures_suggestions(resultats: List[ResultatEpargne], k: int,
+                           critere: str = 'gain_net') -> List[ResultatEpargne]:
+    """
+    Top-k products among one client's suggestions, best first.
+
+    Scalar counterpart of ResultatsEpargne.meilleurs: each product keeps
+    its best scenario, the k best products are picked with a heap and get
+    a 'rang' indicator (1 = best).
+    """
+    if k <= 0:
+        raise ValueError("k doit être positif")
+    meilleurs = {}
+    for r in resultats:
+        score = float(score_classement(critere, r.montant_net_final, r.total_versement,
+                                       r.effort_mensuel, r.atteint_objectif))
+        if score == -np.inf:
+            continue
+        if r.nom_produit not in meilleurs:
+            meilleurs[r.nom_produit] = (score, -len(meilleurs), r)
+        elif score > meilleurs[r.nom_produit][0]:
+            meilleurs[r.nom_produit] = (score, meilleurs[r.nom_produit][1], r)
+    top = heapq.nlargest(k, meilleurs.values(), key=lambda t: t[:2])
+    for rang, (_, _, r) in enumerate(top, start=1):
+        r.indicateurs['rang'] = rang
+    return [r for _, _, r in top]
+
+
+def eligibilite_produits(personnes: PersonneTable, epargnes: EpargneTable) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Clients x products eligibility masks: minimum duration met, and minimum
+    duration met with the objective under the product cap (a missing cap is
+    NaN, which never compares greater, as in suggestion_epargne).
+    """
+    duree_ok = personnes.duree_epargne[:, None] >= epargnes.duree_min[None, :]
+    produit_ok = duree_ok & ~(personnes.objectif[:, None] > epargnes.versement_max[None, :])
+    return duree_ok, produit_ok
+
+
+@metriques.chronometre('suggestion_epargne_resultats')
+def suggestion_epargne_resultats(personnes_df: Union[pd.DataFrame, PersonneTable],
+                                 epargnes_df: Union[pd.DataFrame, EpargneTable],
+                                 table: Optional[utils.TableFacteurs] = None,
+                                 projection: Optional[ProjectionMensuelle] = None,
+                                 monte_carlo: Optional[SimulationMonteCarlo] = None) -> ResultatsEpargne:
+    """
+    Vectorized suggestion_epargne over a whole client portfolio.
+
+    Builds the clients x products x scenarios grid as NumPy arrays
+    (capacity, scenario amounts, duree_min and versement_max masks,
+    gross/net amounts) and returns the kept cells as a columnar
+    ResultatsEpargne, in the same order as calling suggestion_epargne
+    client after client.
+
+    Inputs are cleaned DataFrames or their PersonneTable / EpargneTable.
+    Gross amounts come from a utils.TableFacteurs; pass one to share it
+    across calls on the same catalogue (e.g. successive chunks). With a
+    ProjectionMensuelle built on the same catalogue, deposits are monthly
+    and follow its rate curves instead. With a SimulationMonteCarlo, each
+    result also gets net-amount percentiles and the probability of
+    reaching the objective.
+    """
+    personnes = PersonneTable.coerce(personnes_df)
+    epargnes = EpargneTable.coerce(epargnes_df)
+
+    # Clients (C,)
+    noms_clients = personnes.nom
+    objectif = personnes.objectif
+    duree_epargne = personnes.duree_epargne
+    versement_utilisateur = personnes.versement_mensuel_utilisateur
+
+    # Products (P,)
+    noms_produits = epargnes.nom
+    taux_interet = epargnes.taux_interet
+    fiscalite = epargnes.fiscalite
+    duree_min = epargnes.duree_min
+    versement_max = epargnes.versement_max
+
+    # Scenarios (C, S): user amount first, then shares of the capacity
+    capacite_mensuelle = personnes.calcul_capacite_epargne()
+    montants = np.empty((len(personnes), 1 + len(SCENARIOS_CAPACITE)))
+    montants[:, 0] = versement_utilisateur
+    montants[:, 1:] = capacite_mensuelle[:, None] * np.asarray(SCENARIOS_CAPACITE)
+    scenario_ok = np.ones(montants.shape, dtype=bool)
+    scenario_ok[:, 0] = versement_utilisateur > 0
+
+    # Eligibility (C, P)
+    duree_ok, produit_ok = eligibilite_produits(personnes, epargnes)
+    metriques.incrementer('produits_ignores.duree_min', int((~duree_ok).sum()))
+    metriques.incrementer('produits_ignores.versement_max', int((duree_ok & ~produit_ok).sum()))
+
+    # Kept cells, flattened in (client, product, scenario) order
+    ci, pi, si = np.nonzero(produit_ok[:, :, None] & scenario_ok[:, None, :])
+    vm = montants[ci, si]
+    duree = duree_epargne[ci]
+    versement_annuel = vm * 12
+    if projection is not None:
+        montant_brut = projection.montant_final(pi, vm, duree * 12)
+    else:
+        duree_max = int(duree_epargne.max()) if len(duree_epargne) else 0
+        if table is None:
+            table = utils.TableFacteurs(taux_interet, duree_max)
+        else:
+            table.etendre(duree_max)
+        montant_brut = versement_annuel * table.facteurs(taux_interet[pi], duree)
+    total_versement = versement_annuel * duree
+    gain = montant_brut - total_versement
+    montant_net = total_versement + gain * (1 - fiscalite[pi])
+    capacite = capacite_mensuelle[ci]
+    ratio = np.divide(vm, capacite, out=np.zeros(len(vm)), where=capacite > 0)
+    effort = np.where(vm > 0, vm, 0)
+    indicateurs_lignes = {}
+    if monte_carlo is not None:
+        produits_simules = np.array([monte_carlo.index[nom] for nom in noms_produits], dtype=np.int64)
+        indicateurs_lignes = monte_carlo.indicateurs(produits_simules[pi], effort, duree, objectif[ci])
+
+    resultats = ResultatsEpargne(
+        clients=noms_clients,
+        produits=noms_produits,
+        indicateurs={
+            'taux_interet': taux_interet,
+            'fiscalite': fiscalite,
+            'duree_min': duree_min,
+            'versement_max': versement_max
+        },
+        index_client=ci,
+        index_produit=pi,
+        scenarios=np.where(capacite > 0, np.round(ratio * 100, 2), 0),
+        effort_mensuel=effort,
+        total_versement=total_versement,
+        montant_net_final=np.where(montant_net > 0, montant_net, 0),
+        atteint_objectif=montant_net >= objectif[ci],
+        indicateurs_lignes=indicateurs_lignes
+    )
+    metriques.incrementer('scenarios_generes', len(resultats))
+    logging.info("Generated %d savings scenarios for %d clients.", len(resultats), len(personnes))
     return resultats
 
+
+def suggestion_epargne_batch(personnes_df: Union[pd.DataFrame, PersonneTable],
+                             epargnes_df: Union[pd.DataFrame, EpargneTable],
+                             table: Optional[utils.TableFacteurs] = None,
+                             top_k: Optional[int] = None,
+                             critere: str = 'gain_net') -> pd.DataFrame:
+    """
+    DataFrame form of suggestion_epargne_resultats: the same rows and
+    columns as concatenating ResultatEpargne.to_dataframe() over
+    suggestion_epargne for every client.
+
+    With top_k, only the top_k products of each client by critere are
+    kept (see ResultatsEpargne.meilleurs), with their 'rang'.
+    """
+    resultats = suggestion_epargne_resultats(personnes_df, epargnes_df, table=table)
+    if top_k is not None:
+        resultats = resultats.meilleurs(top_k, critere)
+    return resultats.to_dataframe()
+
+# Product catalogue held by each worker process of export_suggestions_epargne
+_epargnes_worker: Optional[EpargneTable] = None
+_table_worker: Optional[utils.TableFacteurs] = None
+
+def _init_worker(epargnes_df: pd.DataFrame):
+    """
+    Process-pool initializer: receive the catalogue once per worker.
+    """
+    global _epargnes_worker, _table_worker
+    _epargnes_worker = EpargneTable.from_dataframe(epargnes_df)
+    _table_worker = utils.TableFacteurs(_epargnes_worker.taux_interet, 0)
+
+
+def _suggestions_worker(personnes_df: pd.DataFrame,
+                        top_k: Optional[int] = None,
+                        critere: str = 'gain_net') -> Tuple[pd.DataFrame, Counter]:
+    """
+    Suggestions of one chunk, with the counters it added to this process's metrics.
+    """
+    avant = metriques.compteurs.copy()
+    df = suggestion_epargne_batch(personnes_df, _epargnes_worker, table=_table_worker, top_k=top_k, critere=critere)
+    return df, metriques.compteurs - avant
+
+
+def _ecrire_resultat_worker(writer: utils.DataFrameWriter, resultat: Tuple[pd.DataFrame, Counter]):
+    """
+    Write a chunk computed in a worker process and merge its counters here.
+    """
+    df, compteurs = resultat
+    metriques.compteurs.update(compteurs)
+    writer.write(df)
+
+
+@metriques.chronometre('export_suggestions_epargne')
+def export_suggestions_epargne(fichier_personnes: str,
+                               fichier_epargnes: str,
+                               fichier_sortie: str,
+                               chunksize: int = 100_000,
+                               workers: int = 1,
+                               rejets: Optional[str] = None,
+                               top_k: Optional[int] = None,
+                               critere: str = 'gain_net') -> int:
+    """
+    Stream persons in, compute their suggestions chunk by chunk and append
+    each chunk to fichier_sortie (CSV, TXT, Parquet row groups, XLSX, or an
+    indexed SQLite store for .sqlite / .db, see stockage.ResultatsSQLite).
+
+    With workers > 1, chunks are sharded across a process pool; the
+    catalogue is sent once to each worker and results are written in input
+    order, with at most 2 * workers chunks in flight. With rejets, invalid
+    person rows go to that file instead of aborting the export. With top_k,
+    only the top_k products of each client by critere are written. Returns
+    the number of rows written.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    epargnes_df = import_epargnes_dataframe(fichier_epargnes)
+    chunks = iter_personnes(fichier_personnes, chunksize=chunksize, batches=True, rejets=rejets)
+    with utils.DataFrameWriter(fichier_sortie) as writer:
+        if workers <= 1:
+            _init_worker(epargnes_df)
+            for personnes_df in chunks:
+                writer.write(_suggestions_worker(personnes_df, top_k, critere)[0])
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(epargnes_df,)) as pool:
+                en_cours = deque()
+                for personnes_df in chunks:
+                    en_cours.append(pool.submit(_suggestions_worker, personnes_df, top_k, critere))
+                    if len(en_cours) >= 2 * workers:
+                        _ecrire_resultat_worker(writer, en_cours.popleft().result())
+                while en_cours:
+                    _ecrire_resultat_worker(writer, en_cours.popleft().result())
+    return writer.lignes
+
+def _empreintes_run(personnes_df: pd.DataFrame, epargnes_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Fingerprints of the clients and products of a run, one row per name.
+    """
+    import pandas as pd
+
+    return pd.concat([
+        pd.DataFrame({
+            'type': 'personne',
+            'nom': personnes_df['nom'].to_numpy(),
+            'empreinte': utils.empreintes_lignes(personnes_df, PERSONNE_FLOAT_COLS + PERSONNE_INT_COLS).view(np.int64)
+        }),
+        pd.DataFrame({
+            'type': 'epargne',
+            'nom': epargnes_df['nom'].to_numpy(),
+            'empreinte': utils.empreintes_lignes(epargnes_df, EPARGNE_FLOAT_COLS + EPARGNE_INT_COLS).view(np.int64)
+        })
+    ], ignore_index=True)
+
+
+def _lignes_modifiees(courant: pd.DataFrame, precedent: pd.DataFrame, type_ligne: str) -> np.ndarray:
+    """
+    Mask of the current rows of type_ligne that are new or whose fingerprint changed.
+    """
+    import pandas as pd
+
+    courant = courant[courant['type'] == type_ligne]
+    ancien = precedent[precedent['type'] == type_ligne]
+    position = pd.Index(ancien['nom']).get_indexer(courant['nom'])
+    empreintes = ancien['empreinte'].to_numpy(dtype=np.int64)
+    return (position < 0) | (empreintes[position] != courant['empreinte'].to_numpy())
+
+
+@metriques.chronometre('export_suggestions_incremental')
+def export_suggestions_incremental(fichier_personnes: str,
+                                   fichier_epargnes: str,
+                                   fichier_sortie: str,
+                                   fichier_etat: Optional[str] = None) -> Dict[str, int]:
+    """
+    Update fichier_sortie from the previous run, recomputing only the
+    (client, product) cells whose client or product row changed.
+
+    Every client and product row is fingerprinted and the fingerprints of
+    the last run are kept in fichier_etat (default <fichier_sortie>.etat.csv).
+    Rows of changed or removed clients and products are dropped from the
+    previous output; changed clients are computed against the whole
+    catalogue and the other clients against the changed products only.
+    The merged output has the same rows and order as a full run. Without a
+    previous output and state, or when names are not unique, everything
+    is recomputed. Returns the numbers of clients and products recomputed
+    and of rows written.
+    """
+    import pandas as pd
+
+    if fichier_etat is None:
+        fichier_etat = fichier_sortie + '.etat.csv'
+    personnes_df = import_personnes_dataframe(fichier_personnes)
+    epargnes_df = import_epargnes_dataframe(fichier_epargnes)
+    empreintes = _empreintes_run(personnes_df, epargnes_df)
+
+    precedent = None
+    if os.path.exists(fichier_sortie) and os.path.exists(fichier_etat):
+        if personnes_df['nom'].is_unique and epargnes_df['nom'].is_unique:
+            precedent = utils.read_dataframe(fichier_etat)
+        else:
+            logging.warning("Noms de clients ou de produits en double, recalcul complet de %s", fichier_sortie)
+
+    if precedent is None:
+        clients_modifies = np.ones(len(personnes_df), dtype=bool)
+        produits_modifies = np.ones(len(epargnes_df), dtype=bool)
+    else:
+        clients_modifies = _lignes_modifiees(empreintes, precedent, 'personne')
+        produits_modifies = _lignes_modifiees(empreintes, precedent, 'epargne')
+
+    # Changed clients x all products, then unchanged clients x changed products
+    morceaux = []
+    if clients_modifies.any():
+        morceaux.append(suggestion_epargne_batch(personnes_df[clients_modifies], epargnes_df))
+    if produits_modifies.any() and not clients_modifies.all():
+        morceaux.append(suggestion_epargne_batch(personnes_df[~clients_modifies], epargnes_df[produits_modifies]))
+
+    if precedent is not None:
+        anciennes = utils.read_dataframe(fichier_sortie)
+        gardees = (anciennes['nom_client'].isin(personnes_df['nom'][~clients_modifies])
+                   & anciennes['nom_produit'].isin(epargnes_df['nom'][~produits_modifies]))
+        morceaux.insert(0, anciennes[gardees])
+        sortie = pd.concat(morceaux, ignore_index=True)
+        # Same order as a full run: clients, then products; cells of one
+        # (client, product) pair come from a single source and keep their scenario order
+        rang_client = pd.Index(personnes_df['nom']).get_indexer(sortie['nom_client'])
+        rang_produit = pd.Index(epargnes_df['nom']).get_indexer(sortie['nom_produit'])
+        sortie = sortie.iloc[np.lexsort((rang_produit, rang_client))].reset_index(drop=True)
+    elif morceaux:
+        sortie = morceaux[0]
+    else:
+        sortie = suggestion_epargne_batch(personnes_df, epargnes_df)
+
+    utils.write_dataframe(sortie, fichier_sortie)
+    utils.write_dataframe(empreintes, fichier_etat)
+    recalcul = {
+        'clients_recalcules': int(clients_modifies.sum()),
+        'produits_recalcules': int(produits_modifies.sum()),
+        'lignes': len(sortie)
+    }
+    metriques.incrementer('incremental.clients_recalcules', recalcul['clients_recalcules'])
+    metriques.incrementer('incremental.produits_recalcules', recalcul['produits_recalcules'])
+    logging.info("Recalcul incrémental: %d clients et %d produits modifiés, %d lignes",
+                 recalcul['clients_recalcules'], recalcul['produits_recalcules'], recalcul['lignes'])
+    return recalcul
+
 def suggestion_epargne_decorator(func):
     def wrapper(*args, **kwargs):
-        logging.info(f"Début de la suggestion d'épargne for client: {args[0].nom if args else 'Inconnu'}")
-        return func(*args, **kwargs)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Début de la suggestion d'épargne for client: %s", args[0].nom if args else 'Inconnu')
+        metriques.incrementer('clients')
+        with metriques.chrono('suggestion_epargne'):
+            return func(*args, **kwargs)
     return wrapper
 
 @suggestion_epargne_decorator
-def suggestion_epargne_with_decorator(personne: Personne, epargnes: List[Epargne]) -> List[ResultatEpargne]:
+def suggestion_epargne_with_decorator(personne: Personne, epargnes: List[Epargne],
+                                      cache: Optional[SuggestionCache] = None) -> List[ResultatEpargne]:
     """
     Wrapper function to log the start of the savings suggestion process.
     """
-    return suggestion_epargne(personne, epargnes)
\ No newline at end of file
+    return suggestion_epargne(personne, epargnes, cache=cache)
\ No newline at end of file
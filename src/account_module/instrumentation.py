@@ -0,0 +1,140 @@
+import cProfile
+import functools
+import json
+import logging
+import os
+import pstats
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+# Environment variables read by session_instrumentee
+ENV_PROFIL = 'ACCOUNT_MODULE_PROFILE'          # "cprofile" or "tracemalloc"
+ENV_PROFIL_SORTIE = 'ACCOUNT_MODULE_PROFILE_OUT'
+ENV_METRIQUES = 'ACCOUNT_MODULE_METRICS'       # path of the JSON metrics dump
+
+
+class Metriques:
+    """
+    Process-wide counters and per-stage timers.
+
+    Counters are plain Counter increments and timers two perf_counter
+    calls, cheap enough to stay on in the hot path.
+    """
+
+    def __init__(self):
+        self.compteurs: Counter = Counter()
+        self.durees: Dict[str, float] = defaultdict(float)
+        self.appels: Counter = Counter()
+        self.extras: Dict[str, Any] = {}
+
+    def incrementer(self, nom: str, n: int = 1):
+        self.compteurs[nom] += n
+
+    @contextmanager
+    def chrono(self, etape: str):
+        """
+        Add the duration of the block to the timer of etape.
+        """
+        debut = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durees[etape] += time.perf_counter() - debut
+            self.appels[etape] += 1
+
+    def chronometre(self, etape: str):
+        """
+        Decorator form of chrono.
+        """
+        def decorateur(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.chrono(etape):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorateur
+
+    def reset(self):
+        self.compteurs.clear()
+        self.durees.clear()
+        self.appels.clear()
+        self.extras.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'compteurs': dict(self.compteurs),
+            'etapes': {etape: {'secondes': self.durees[etape], 'appels': self.appels[etape]}
+                       for etape in self.durees},
+            **self.extras,
+        }
+
+    def dump_json(self, fichier: str):
+        with open(fichier, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logging.info("Métriques enregistrées dans %s", fichier)
+
+
+metriques = Metriques()
+
+
+@contextmanager
+def profilage(mode: Optional[str] = None, sortie: Optional[str] = None):
+    """
+    Profile the block with cProfile or tracemalloc.
+
+    mode and sortie default to the ACCOUNT_MODULE_PROFILE and
+    ACCOUNT_MODULE_PROFILE_OUT environment variables; nothing is done when
+    no mode is set. cProfile stats are written to sortie (or the top
+    functions logged); tracemalloc peak and top allocations go to the
+    metrics.
+    """
+    mode = (mode or os.environ.get(ENV_PROFIL) or '').lower()
+    sortie = sortie or os.environ.get(ENV_PROFIL_SORTIE)
+    if mode == 'cprofile':
+        profil = cProfile.Profile()
+        profil.enable()
+        try:
+            yield
+        finally:
+            profil.disable()
+            if sortie:
+                profil.dump_stats(sortie)
+                logging.info("Profil cProfile enregistré dans %s", sortie)
+            else:
+                pstats.Stats(profil).sort_stats('cumulative').print_stats(20)
+    elif mode == 'tracemalloc':
+        tracemalloc.start()
+        try:
+            yield
+        finally:
+            _, pic = tracemalloc.get_traced_memory()
+            top = tracemalloc.take_snapshot().statistics('lineno')[:10]
+            tracemalloc.stop()
+            metriques.extras['tracemalloc'] = {
+                'pic_octets': pic,
+                'top': [{'ligne': str(stat.traceback), 'octets': stat.size} for stat in top],
+            }
+    elif mode:
+        raise ValueError(f"Mode de profilage inconnu: {mode}")
+    else:
+        yield
+
+
+@contextmanager
+def session_instrumentee(fichier_metriques: Optional[str] = None):
+    """
+    Instrument a whole run: reset the metrics, profile if requested, and
+    dump the metrics as JSON at the end (to fichier_metriques or
+    ACCOUNT_MODULE_METRICS, if set).
+    """
+    fichier_metriques = fichier_metriques or os.environ.get(ENV_METRIQUES)
+    metriques.reset()
+    try:
+        with metriques.chrono('total'), profilage():
+            yield metriques
+    finally:
+        if fichier_metriques:
+            metriques.dump_json(fichier_metriques)
@@ -1,10 +1,14 @@
 class Epargne:
-    def __init__(self, nom: str, taux_interet: float, fiscalite: float, duree_min: int, versement_max: float= None):
+    __slots__ = ('nom', 'taux_interet', 'fiscalite', 'duree_min', 'versement_max', 'volatilite')
+
+    def __init__(self, nom: str, taux_interet: float, fiscalite: float, duree_min: int, versement_max: float= None, volatilite: float = 0.0):
         self.nom: str = nom
         self.taux_interet: float = taux_interet
         self.fiscalite: float = fiscalite
         self.duree_min: int = duree_min
         self.versement_max: float = versement_max if versement_max is not None else float('inf')
+        # Annual volatility of the return, used by the Monte-Carlo projections
+        self.volatilite: float = volatilite
 
     def __repr__(self):
         return (f"Epargne(nom={self.nom}, taux_interet={self.taux_interet}, "
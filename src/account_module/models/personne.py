@@ -1,4 +1,7 @@
 class Personne:
+    __slots__ = ('nom', 'age', 'revenu_annuel', 'loyer', 'depenses_mensuelles',
+                 'objectif', 'duree_epargne', 'versement_mensuel_utilisateur')
+
     def __init__(self, nom: str, age: int, revenu_annuel: float, loyer: float, depenses_mensuelles: float, objectif: float, duree_epargne: int, versement_mensuel_utilisateur: float =None):
         self.nom: str = nom
         self.age: int = age
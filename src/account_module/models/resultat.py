@@ -1,6 +1,11 @@
-from dataclasses import dataclass, field
-import pandas as pd
-from typing import Any, Dict
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+import numpy as np
+from typing import TYPE_CHECKING, Any, Dict, Iterator
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 @dataclass
 class ResultatEpargne:
@@ -45,6 +50,8 @@ class ResultatEpargne:
         Returns:
             pd.DataFrame: DataFrame with columns for each attribute and any extra indicators.
         """
+        import pandas as pd
+
         # Base data
         data = {
             'nom_client': self.nom_client,
@@ -60,3 +67,185 @@ class ResultatEpargne:
         # Create DataFrame
         df = pd.DataFrame([data])
         return df
+
+
+# Ranking criteria of ResultatsEpargne.meilleurs
+CRITERES_CLASSEMENT = ('gain_net', 'effort_minimal', 'efficacite_fiscale')
+
+
+def score_classement(critere: str, montant_net_final, total_versement, effort_mensuel, atteint_objectif):
+    """
+    Ranking score of results (scalars or arrays), higher is better.
+    Results without deposits are not recommendations and score -inf.
+
+    gain_net: net final amount minus deposits. effort_minimal: lowest
+    monthly effort among results reaching objectif (others score -inf).
+    efficacite_fiscale: net gain per euro deposited, after tax.
+    """
+    montant_net_final = np.asarray(montant_net_final, dtype=float)
+    total_versement = np.asarray(total_versement, dtype=float)
+    gain_net = montant_net_final - total_versement
+    if critere == 'gain_net':
+        score = gain_net
+    elif critere == 'effort_minimal':
+        score = np.where(atteint_objectif, -np.asarray(effort_mensuel, dtype=float), -np.inf)
+    elif critere == 'efficacite_fiscale':
+        score = np.divide(gain_net, total_versement, out=np.full(gain_net.shape, -np.inf), where=total_versement > 0)
+        # The ratio does not depend on the amount: round off float noise between scenarios
+        score = np.round(score, 9)
+    else:
+        raise ValueError(f"Critère de classement inconnu: {critere} (attendu: {', '.join(CRITERES_CLASSEMENT)})")
+    return np.where(np.isnan(score) | (total_versement <= 0), -np.inf, score)
+
+
+@dataclass(eq=False)
+class ResultatsEpargne:
+    """
+    Columnar collection of savings suggestions, one NumPy array per field.
+
+    Client names and product indicators are stored once and referenced by
+    index, instead of a name and an indicator dict per row.
+
+    Attributes:
+        clients (np.ndarray): Client names, indexed by index_client.
+        produits (np.ndarray): Product names, indexed by index_produit.
+        indicateurs (Dict[str, np.ndarray]): Product indicators, one array per key, indexed by index_produit.
+        index_client (np.ndarray): Client of each result.
+        index_produit (np.ndarray): Product of each result.
+        scenarios (np.ndarray): Scenario label of each result.
+        effort_mensuel (np.ndarray): Monthly contribution effort.
+        total_versement (np.ndarray): Total deposits over the duration.
+        montant_net_final (np.ndarray): Final net amount after taxes.
+        atteint_objectif (np.ndarray): Whether the savings goal was reached.
+        indicateurs_lignes (Dict[str, np.ndarray]): Extra per-result metrics, one array per key.
+    """
+    clients: np.ndarray
+    produits: np.ndarray
+    indicateurs: Dict[str, np.ndarray]
+    index_client: np.ndarray
+    index_produit: np.ndarray
+    scenarios: np.ndarray
+    effort_mensuel: np.ndarray
+    total_versement: np.ndarray
+    montant_net_final: np.ndarray
+    atteint_objectif: np.ndarray
+    indicateurs_lignes: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.index_client)
+
+    def __getitem__(self, i: int) -> ResultatEpargne:
+        """
+        Builds the ResultatEpargne view of the i-th result.
+        """
+        p = self.index_produit[i]
+        indicateurs = {key: valeurs[p].item() for key, valeurs in self.indicateurs.items()}
+        indicateurs.update((key, valeurs[i].item()) for key, valeurs in self.indicateurs_lignes.items())
+        return ResultatEpargne(
+            nom_client=self.clients[self.index_client[i]],
+            scenarios=self.scenarios[i].item(),
+            nom_produit=self.produits[p],
+            effort_mensuel=self.effort_mensuel[i].item(),
+            total_versement=self.total_versement[i].item(),
+            montant_net_final=self.montant_net_final[i].item(),
+            atteint_objectif=bool(self.atteint_objectif[i]),
+            indicateurs=indicateurs
+        )
+
+    def __iter__(self) -> Iterator[ResultatEpargne]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def selection(self, lignes: np.ndarray) -> 'ResultatsEpargne':
+        """
+        Results at the given row indices; names and product indicators are shared.
+        """
+        return replace(
+            self,
+            index_client=self.index_client[lignes],
+            index_produit=self.index_produit[lignes],
+            scenarios=self.scenarios[lignes],
+            effort_mensuel=self.effort_mensuel[lignes],
+            total_versement=self.total_versement[lignes],
+            montant_net_final=self.montant_net_final[lignes],
+            atteint_objectif=self.atteint_objectif[lignes],
+            indicateurs_lignes={key: valeurs[lignes] for key, valeurs in self.indicateurs_lignes.items()}
+        )
+
+    def meilleurs(self, k: int, critere: str = 'gain_net') -> 'ResultatsEpargne':
+        """
+        Top-k products of each client by critere (see score_classement), best first.
+
+        Each product is represented by its best scenario (the first one on
+        ties). Best scores per (client, product) are gathered in a dense
+        clients x products matrix and the k best of every client are picked
+        with a partial selection (np.partition, ties in catalogue order), so
+        only the selected rows are ever expanded.
+        Products with no valid score are left out; a 'rang' column (1 = best)
+        is added to indicateurs_lignes.
+        """
+        if k <= 0:
+            raise ValueError("k doit être positif")
+        score = score_classement(critere, self.montant_net_final, self.total_versement,
+                                 self.effort_mensuel, self.atteint_objectif)
+        n_clients, n_produits = len(self.clients), len(self.produits)
+        paire = self.index_client * n_produits + self.index_produit
+
+        # Best score and first row reaching it, per (client, product)
+        meilleur = np.full(n_clients * n_produits, -np.inf)
+        np.maximum.at(meilleur, paire, score)
+        candidats = np.flatnonzero(score == meilleur[paire])
+        ligne = np.full(n_clients * n_produits, len(self), dtype=np.int64)
+        np.minimum.at(ligne, paire[candidats], candidats)
+        meilleur = meilleur.reshape(n_clients, n_produits)
+
+        k = min(k, n_produits)
+        if k < n_produits:
+            # k-th best score of each client, then everything above it plus
+            # the first products (catalogue order) tied with it
+            seuil = -np.partition(-meilleur, k - 1, axis=1)[:, k - 1:k]
+            au_dessus = meilleur > seuil
+            egal = meilleur == seuil
+            manque = k - au_dessus.sum(axis=1, keepdims=True)
+            choisi = au_dessus | (egal & (np.cumsum(egal, axis=1) <= manque))
+            top = np.nonzero(choisi)[1].reshape(n_clients, k)
+        else:
+            top = np.broadcast_to(np.arange(n_produits), (n_clients, n_produits))
+        # Order the k picks by score, then catalogue order on ties
+        valeurs = np.take_along_axis(meilleur, top, axis=1)
+        top = np.take_along_axis(top, np.lexsort((top, -valeurs), axis=1), axis=1)
+        garde = np.isfinite(np.take_along_axis(meilleur, top, axis=1))
+        lignes = ligne[(np.arange(n_clients)[:, None] * n_produits + top)[garde]]
+        resultats = self.selection(lignes)
+        resultats.indicateurs_lignes['rang'] = np.broadcast_to(np.arange(1, k + 1), garde.shape)[garde]
+        return resultats
+
+    def to_dataframe(self, arrondi: bool = True) -> pd.DataFrame:
+        """
+        Exports all results to a pandas DataFrame, one row per result.
+
+        Columns match ResultatEpargne.to_dataframe. With arrondi=False the
+        per-row numeric arrays are handed to pandas without copying; only
+        names and product indicators are expanded to one value per row.
+
+        Returns:
+            pd.DataFrame: DataFrame with columns for each attribute and the product indicators.
+        """
+        import pandas as pd
+
+        def valeurs(col: np.ndarray) -> np.ndarray:
+            return np.round(col, 2) if arrondi else col
+
+        data = {
+            'nom_client': self.clients[self.index_client],
+            'scenarios': self.scenarios,
+            'nom_produit': self.produits[self.index_produit],
+            'effort_mensuel': valeurs(self.effort_mensuel),
+            'total_versement': valeurs(self.total_versement),
+            'montant_net_final': valeurs(self.montant_net_final),
+            'atteint_objectif': self.atteint_objectif,
+        }
+        for key, col in self.indicateurs.items():
+            data[key] = col[self.index_produit]
+        data.update(self.indicateurs_lignes)
+        return pd.DataFrame(data, copy=False)
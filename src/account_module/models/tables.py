@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+import numpy as np
+from typing import TYPE_CHECKING, Iterator, List, Union
+
+from src.account_module.models.personne import Personne
+from src.account_module.models.epargne import Epargne
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass(eq=False)
+class PersonneTable:
+    """
+    Struct-of-arrays storage for many persons, one NumPy array per Personne field.
+
+    Attributes mirror Personne; a missing versement_mensuel_utilisateur is 0.
+    """
+    nom: np.ndarray
+    age: np.ndarray
+    revenu_annuel: np.ndarray
+    loyer: np.ndarray
+    depenses_mensuelles: np.ndarray
+    objectif: np.ndarray
+    duree_epargne: np.ndarray
+    versement_mensuel_utilisateur: np.ndarray
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> 'PersonneTable':
+        """
+        Builds a table from a cleaned persons DataFrame.
+        """
+        if 'versement_mensuel_utilisateur' in df.columns:
+            versement = df['versement_mensuel_utilisateur'].to_numpy(dtype=float, na_value=0.0)
+        else:
+            versement = np.zeros(len(df))
+        return cls(
+            nom=df['nom'].to_numpy(dtype=object),
+            age=df['age'].to_numpy(dtype=np.int64),
+            revenu_annuel=df['revenu_annuel'].to_numpy(dtype=float),
+            loyer=df['loyer'].to_numpy(dtype=float),
+            depenses_mensuelles=df['depenses_mensuelles'].to_numpy(dtype=float),
+            objectif=df['objectif'].to_numpy(dtype=float),
+            duree_epargne=df['duree_epargne'].to_numpy(dtype=np.int64),
+            versement_mensuel_utilisateur=versement
+        )
+
+    @classmethod
+    def coerce(cls, personnes: Union['PersonneTable', pd.DataFrame, List[Personne]]) -> 'PersonneTable':
+        """
+        Returns personnes as a table, converting a DataFrame or a list of Personne.
+        """
+        if isinstance(personnes, cls):
+            return personnes
+        if isinstance(personnes, (list, tuple)):
+            return cls.from_personnes(personnes)
+        import pandas as pd
+
+        if isinstance(personnes, pd.DataFrame):
+            return cls.from_dataframe(personnes)
+        return cls.from_personnes(personnes)
+
+    @classmethod
+    def from_personnes(cls, personnes: List[Personne]) -> 'PersonneTable':
+        """
+        Builds a table from Personne instances.
+        """
+        return cls(
+            nom=np.array([p.nom for p in personnes], dtype=object),
+            age=np.array([p.age for p in personnes], dtype=np.int64),
+            revenu_annuel=np.array([p.revenu_annuel for p in personnes], dtype=float),
+            loyer=np.array([p.loyer for p in personnes], dtype=float),
+            depenses_mensuelles=np.array([p.depenses_mensuelles for p in personnes], dtype=float),
+            objectif=np.array([p.objectif for p in personnes], dtype=float),
+            duree_epargne=np.array([p.duree_epargne for p in personnes], dtype=np.int64),
+            versement_mensuel_utilisateur=np.array([p.versement_mensuel_utilisateur for p in personnes], dtype=float)
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Exports the table to a DataFrame without copying the arrays.
+        """
+        import pandas as pd
+
+        return pd.DataFrame({f.name: getattr(self, f.name) for f in fields(self)}, copy=False)
+
+    def calcul_capacite_epargne(self) -> np.ndarray:
+        """
+        Monthly savings capacity of every person (Personne.calcul_capacite_epargne).
+        """
+        return (self.revenu_annuel / 12) - self.loyer - self.depenses_mensuelles
+
+    def __len__(self) -> int:
+        return len(self.nom)
+
+    def __getitem__(self, i: int) -> Personne:
+        return Personne(
+            nom=self.nom[i],
+            age=int(self.age[i]),
+            revenu_annuel=float(self.revenu_annuel[i]),
+            loyer=float(self.loyer[i]),
+            depenses_mensuelles=float(self.depenses_mensuelles[i]),
+            objectif=float(self.objectif[i]),
+            duree_epargne=int(self.duree_epargne[i]),
+            versement_mensuel_utilisateur=float(self.versement_mensuel_utilisateur[i])
+        )
+
+    def __iter__(self) -> Iterator[Personne]:
+        for i in range(len(self)):
+            yield self[i]
+
+
+@dataclass(eq=False)
+class EpargneTable:
+    """
+    Struct-of-arrays storage for a product catalogue, one NumPy array per Epargne field.
+
+    A missing versement_max stays NaN, which never excludes a product;
+    a missing volatilite is 0.
+    """
+    nom: np.ndarray
+    taux_interet: np.ndarray
+    fiscalite: np.ndarray
+    duree_min: np.ndarray
+    versement_max: np.ndarray
+    volatilite: np.ndarray
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> 'EpargneTable':
+        """
+        Builds a table from a cleaned products DataFrame.
+        """
+        return cls(
+            nom=df['nom'].to_numpy(dtype=object),
+            taux_interet=df['taux_interet'].to_numpy(dtype=float),
+            fiscalite=df['fiscalite'].to_numpy(dtype=float),
+            duree_min=df['duree_min'].to_numpy(dtype=np.int64),
+            versement_max=df['versement_max'].to_numpy(dtype=float, na_value=np.nan),
+            volatilite=(df['volatilite'].to_numpy(dtype=float, na_value=0.0) if 'volatilite' in df.columns
+                        else np.zeros(len(df)))
+        )
+
+    @classmethod
+    def coerce(cls, epargnes: Union['EpargneTable', pd.DataFrame, List[Epargne]]) -> 'EpargneTable':
+        """
+        Returns epargnes as a table, converting a DataFrame or a list of Epargne.
+        """
+        if isinstance(epargnes, cls):
+            return epargnes
+        if isinstance(epargnes, (list, tuple)):
+            return cls.from_epargnes(epargnes)
+        import pandas as pd
+
+        if isinstance(epargnes, pd.DataFrame):
+            return cls.from_dataframe(epargnes)
+        return cls.from_epargnes(epargnes)
+
+    @classmethod
+    def from_epargnes(cls, epargnes: List[Epargne]) -> 'EpargneTable':
+        """
+        Builds a table from Epargne instances.
+        """
+        return cls(
+            nom=np.array([e.nom for e in epargnes], dtype=object),
+            taux_interet=np.array([e.taux_interet for e in epargnes], dtype=float),
+            fiscalite=np.array([e.fiscalite for e in epargnes], dtype=float),
+            duree_min=np.array([e.duree_min for e in epargnes], dtype=np.int64),
+            versement_max=np.array([e.versement_max for e in epargnes], dtype=float),
+            volatilite=np.array([e.volatilite for e in epargnes], dtype=float)
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Exports the table to a DataFrame without copying the arrays.
+        """
+        import pandas as pd
+
+        return pd.DataFrame({f.name: getattr(self, f.name) for f in fields(self)}, copy=False)
+
+    def __len__(self) -> int:
+        return len(self.nom)
+
+    def __getitem__(self, i: int) -> Epargne:
+        return Epargne(
+            nom=self.nom[i],
+            taux_interet=float(self.taux_interet[i]),
+            fiscalite=float(self.fiscalite[i]),
+            duree_min=int(self.duree_min[i]),
+            versement_max=float(self.versement_max[i]),
+            volatilite=float(self.volatilite[i])
+        )
+
+    def __iter__(self) -> Iterator[Epargne]:
+        for i in range(len(self)):
+            yield self[i]
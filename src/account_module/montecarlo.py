@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from src.account_module.models.epargne import Epargne
+from src.account_module.models.tables import EpargneTable
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class SimulationMonteCarlo:
+    """
+    Stochastic projections of annual deposits, generated once per product.
+
+    Each product gets `chemins` paths of annual returns, lognormal with mean
+    taux_interet and standard deviation volatilite (a product with no
+    volatility reduces to the deterministic formula). For every path and
+    duration n the capitalisation factor A_n (value of 1 € deposited at the
+    start of each year) is stored sorted, so that clients only cost
+    lookups: the net amount is affine in A_n, hence its percentiles and the
+    probability of reaching objectif come from precomputed percentiles and
+    a bisection in the sorted factors.
+    """
+
+    def __init__(self, epargnes: Union[pd.DataFrame, EpargneTable, List[Epargne]],
+                 duree_max: int,
+                 chemins: int = 10_000,
+                 seed: Optional[int] = None,
+                 percentiles: Sequence[int] = (5, 50, 95)):
+        self.epargnes = EpargneTable.coerce(epargnes)
+        self.duree_max = int(duree_max)
+        self.chemins = chemins
+        self.percentiles = tuple(percentiles)
+        self.index = {nom: p for p, nom in enumerate(self.epargnes.nom)}
+        rng = np.random.default_rng(seed)
+
+        # Sorted factors (P, duree_max + 1, chemins); A_0 = 0
+        self.facteurs_tries = np.zeros((len(self.epargnes), self.duree_max + 1, chemins))
+        for p, (taux, sigma) in enumerate(zip(self.epargnes.taux_interet, self.epargnes.volatilite)):
+            # log(1 + R) ~ N(mu, s^2) with E[1 + R] = 1 + taux and sd(R) = sigma
+            s2 = np.log1p((sigma / (1 + taux)) ** 2)
+            mu = np.log1p(taux) - s2 / 2
+            croissance = np.exp(rng.normal(mu, np.sqrt(s2), size=(chemins, self.duree_max)))
+            facteur = np.zeros(chemins)
+            for n in range(self.duree_max):
+                facteur = (facteur + 1) * croissance[:, n]
+                self.facteurs_tries[p, n + 1] = facteur
+        self.facteurs_tries.sort(axis=2)
+
+        # Percentiles of A_n for each requested q and its mirror 100 - q
+        # (the mirror serves deposits whose coefficient is negative)
+        self._quantiles = sorted(set(self.percentiles) | {100 - q for q in self.percentiles})
+        self._rang = {q: j for j, q in enumerate(self._quantiles)}
+        self._valeurs_quantiles = np.moveaxis(np.percentile(self.facteurs_tries, self._quantiles, axis=2), 0, -1)
+
+    def indicateurs(self, index_produit, versement_mensuel, duree_annees, objectif) -> Dict[str, np.ndarray]:
+        """
+        Percentiles of the net final amount and probability of reaching
+        objectif, for aligned arrays of products, monthly deposits,
+        durations and objectives.
+        """
+        p = np.asarray(index_produit, dtype=np.int64)
+        n = np.clip(np.asarray(duree_annees, dtype=np.int64), 0, None)
+        if n.size and n.max() > self.duree_max:
+            raise ValueError(f"Durée supérieure à la durée simulée ({self.duree_max})")
+        versement_annuel = 12 * np.asarray(versement_mensuel, dtype=float)
+        objectif = np.asarray(objectif, dtype=float)
+        fiscalite = self.epargnes.fiscalite[p]
+        # net = total + (brut - total) * (1 - fiscalite) = a + b * A_n
+        a = versement_annuel * n * fiscalite
+        b = versement_annuel * (1 - fiscalite)
+
+        resultat = {}
+        for q in self.percentiles:
+            haut = self._valeurs_quantiles[p, n, self._rang[q]]
+            bas = self._valeurs_quantiles[p, n, self._rang[100 - q]]
+            resultat[f'montant_net_p{q}'] = a + b * np.where(b >= 0, haut, bas)
+
+        seuil = np.divide(objectif - a, b, out=np.zeros(len(p)), where=b != 0)
+        atteints = np.where(a >= objectif, float(self.chemins), 0.0)
+        cles, groupes = np.unique(p * (self.duree_max + 1) + n, return_inverse=True)
+        ordre = np.argsort(groupes, kind='stable')
+        bornes = np.searchsorted(groupes[ordre], np.arange(len(cles) + 1))
+        for g, cle in enumerate(cles):
+            lignes = ordre[bornes[g]:bornes[g + 1]]
+            tries = self.facteurs_tries[cle // (self.duree_max + 1), cle % (self.duree_max + 1)]
+            positif = b[lignes] > 0
+            negatif = b[lignes] < 0
+            s = seuil[lignes]
+            atteints[lignes[positif]] = self.chemins - np.searchsorted(tries, s[positif], side='left')
+            atteints[lignes[negatif]] = np.searchsorted(tries, s[negatif], side='right')
+        resultat['proba_objectif'] = atteints / self.chemins
+        return resultat
+
+    def indicateurs_produit(self, epargne: Epargne, versement_mensuel: float,
+                            duree_annees: int, objectif: float) -> Dict[str, float]:
+        """
+        Scalar form of indicateurs for one product of the simulated catalogue.
+        """
+        valeurs = self.indicateurs([self.index[epargne.nom]], [versement_mensuel], [duree_annees], [objectif])
+        return {cle: float(v[0]) for cle, v in valeurs.items()}
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+
+import src.account_module.utils as utils
+from src.account_module.models.tables import EpargneTable
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def charger_courbes(fichier: str) -> pd.DataFrame:
+    """
+    Read a rate-curve file (columns nom, mois, taux_interet): each row sets
+    the annual rate of product `nom` from month `mois` of the projection on.
+    """
+    df = utils.read_dataframe(fichier)
+    return utils.clean_dataframe(df, float_cols=['taux_interet'], int_cols=['mois'], copy=False)
+
+
+class ProjectionMensuelle:
+    """
+    Monthly projection engine with per-product, piecewise-constant rate curves.
+
+    Deposits are made at the start of each month and compound at the
+    monthly equivalent (1 + t)^(1/12) - 1 of the annual rate in force.
+    Products without a curve keep their constant taux_interet. Cumulative
+    growth factors G (G[p, m] = growth of 1 € from month 0 to month m) and
+    prefix sums of 1 / G are computed once per product, so a projection is
+    a lookup for constant deposits and a dot product for a schedule:
+
+        final = G[p, M] * sum(depot[m] / G[p, m] for m < M)
+    """
+
+    def __init__(self, epargnes: Union[pd.DataFrame, EpargneTable],
+                 horizon_mois: int,
+                 courbes: Optional[pd.DataFrame] = None):
+        self.epargnes = EpargneTable.coerce(epargnes)
+        self.courbes = courbes
+        self.horizon_mois = 0
+        self.etendre(horizon_mois)
+
+    def etendre(self, horizon_mois: int):
+        """
+        Recompute the curves so they cover horizon_mois months (the last
+        rate of each curve carries on).
+        """
+        if horizon_mois <= self.horizon_mois and self.horizon_mois > 0:
+            return
+        self.horizon_mois = int(horizon_mois)
+        taux = np.repeat(self.epargnes.taux_interet[:, None], self.horizon_mois, axis=1)
+        if self.courbes is not None and self.horizon_mois > 0:
+            index = {nom: p for p, nom in enumerate(self.epargnes.nom)}
+            for nom, points in self.courbes.sort_values('mois').groupby('nom', sort=False):
+                p = index.get(nom)
+                if p is None:
+                    continue
+                for mois, t in zip(points['mois'].to_numpy(dtype=np.int64), points['taux_interet'].to_numpy(dtype=float)):
+                    if mois < self.horizon_mois:
+                        taux[p, max(mois, 0):] = t
+        self.taux_annuels = taux
+        croissance_mensuelle = np.power(1 + taux, 1 / 12)
+        self.croissance = np.ones((len(self.epargnes), self.horizon_mois + 1))
+        np.cumprod(croissance_mensuelle, axis=1, out=self.croissance[:, 1:])
+        self.somme_inverse = np.zeros_like(self.croissance)
+        np.cumsum(1 / self.croissance[:, :-1], axis=1, out=self.somme_inverse[:, 1:])
+
+    def montant_final(self, index_produit, versement_mensuel, duree_mois) -> np.ndarray:
+        """
+        Final amount of a constant monthly deposit over duree_mois months,
+        for aligned arrays of product indices, deposits and durations.
+        """
+        duree_mois = np.clip(np.asarray(duree_mois, dtype=np.int64), 0, None)
+        if duree_mois.size and duree_mois.max() > self.horizon_mois:
+            self.etendre(int(duree_mois.max()))
+        index_produit = np.asarray(index_produit, dtype=np.int64)
+        return (np.asarray(versement_mensuel, dtype=float)
+                * self.croissance[index_produit, duree_mois] * self.somme_inverse[index_produit, duree_mois])
+
+    def montant_final_echeancier(self, index_produit: int, echeancier) -> np.ndarray:
+        """
+        Final amounts of monthly deposit schedules in one product.
+
+        echeancier is (clients, mois): one row of monthly deposits per client,
+        all over the same number of months.
+        """
+        echeancier = np.atleast_2d(np.asarray(echeancier, dtype=float))
+        mois = echeancier.shape[1]
+        if mois > self.horizon_mois:
+            self.etendre(mois)
+        croissance = self.croissance[index_produit]
+        return croissance[mois] * (echeancier @ (1 / croissance[:mois]))
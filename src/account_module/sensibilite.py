@@ -0,0 +1,90 @@
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+import src.account_module.utils as utils
+from src.account_module.models.epargne import Epargne
+from src.account_module.models.personne import Personne
+from src.account_module.models.tables import EpargneTable, PersonneTable
+
+# Levels of the balayage_sensibilite index
+NIVEAUX_BALAYAGE = ['nom_client', 'nom_produit', 'delta_taux', 'delta_fiscalite', 'delta_duree', 'effort']
+
+
+def balayage_sensibilite(personnes_df: Union[pd.DataFrame, PersonneTable, List[Personne]],
+                         epargnes_df: Union[pd.DataFrame, EpargneTable, List[Epargne]],
+                         delta_taux: Sequence[float] = (0.0,),
+                         delta_fiscalite: Sequence[float] = (0.0,),
+                         delta_duree: Sequence[int] = (0,),
+                         efforts: Optional[Sequence[float]] = None) -> pd.DataFrame:
+    """
+    What-if sweep of suggestion_epargne over a grid of variations.
+
+    Every product's taux_interet and fiscalite are shifted by each value of
+    delta_taux and delta_fiscalite (e.g. -0.005 for "rates drop by 0.5 pt"),
+    every client's duree_epargne by each value of delta_duree, and each
+    monthly effort in efforts is tried (by default the client's full
+    monthly capacity, labelled 'capacite'). Eligibility (duree_min and
+    versement_max) is checked for each shifted duration.
+
+    The whole Cartesian grid is evaluated in one broadcast pass: the
+    capitalisation factor depends only on (rate, duration) and is computed
+    once per distinct pair, and the net amount is linear in the effort.
+    Returns one row per eligible cell, indexed by NIVEAUX_BALAYAGE.
+    """
+    personnes = PersonneTable.coerce(personnes_df)
+    epargnes = EpargneTable.coerce(epargnes_df)
+    delta_taux = np.asarray(delta_taux, dtype=float)
+    delta_fiscalite = np.asarray(delta_fiscalite, dtype=float)
+    delta_duree = np.asarray(delta_duree, dtype=np.int64)
+
+    # Axes: client, product, taux, fiscalite, duree (, effort)
+    taux = epargnes.taux_interet[:, None] + delta_taux[None, :]
+    fiscalite = np.clip(epargnes.fiscalite[:, None] + delta_fiscalite[None, :], 0, 1)
+    duree = np.maximum(personnes.duree_epargne[:, None] + delta_duree[None, :], 0)
+
+    # One factor per (product, rate shift, distinct duration)
+    durees, position = np.unique(duree, return_inverse=True)
+    facteurs = utils.facteur_capitalisation_vectorise(taux[:, :, None], durees[None, None, :])
+    facteur = np.moveaxis(facteurs[:, :, position.reshape(duree.shape)], 2, 0)[:, :, :, None, :]
+    n = duree[:, None, None, None, :]
+    # Net amount per 1 € of monthly deposit, as in solveur.facteur_net
+    coefficient = 12 * (n + (facteur - n) * (1 - fiscalite[None, :, None, :, None]))
+
+    eligible = ((duree[:, None, :] >= epargnes.duree_min[None, :, None])
+                & ~(personnes.objectif[:, None, None] > epargnes.versement_max[None, :, None]))
+
+    if efforts is None:
+        labels_effort = ['capacite']
+        versement = personnes.calcul_capacite_epargne()[:, None]
+    else:
+        labels_effort = list(efforts)
+        versement = np.broadcast_to(np.asarray(efforts, dtype=float), (len(personnes), len(labels_effort)))
+    versement = np.maximum(versement, 0)
+
+    forme = coefficient.shape + (versement.shape[1],)
+    masque = np.broadcast_to(eligible[:, :, None, None, :, None], forme)
+    ci, pi, ti, fi, di, ei = np.nonzero(masque)
+    vm = versement[ci, ei]
+    duree_cellule = duree[ci, di]
+    total_versement = 12 * vm * duree_cellule
+    montant_net = vm * coefficient[ci, pi, ti, fi, di]
+
+    # Index built from level codes: labels are never repeated per row
+    levels, codes = [], []
+    for valeurs, lignes in [(personnes.nom, ci), (epargnes.nom, pi), (delta_taux, ti),
+                            (delta_fiscalite, fi), (delta_duree, di), (labels_effort, ei)]:
+        code, uniques = pd.factorize(np.asarray(valeurs))
+        levels.append(uniques)
+        codes.append(code[lignes])
+    index = pd.MultiIndex(levels=levels, codes=codes, names=NIVEAUX_BALAYAGE, verify_integrity=False)
+    return pd.DataFrame({
+        'taux_interet': taux[pi, ti],
+        'fiscalite': fiscalite[pi, fi],
+        'duree_epargne': duree_cellule,
+        'effort_mensuel': np.round(vm, 2),
+        'total_versement': np.round(total_versement, 2),
+        'montant_net_final': np.round(montant_net, 2),
+        'atteint_objectif': montant_net >= personnes.objectif[ci],
+    }, index=index)
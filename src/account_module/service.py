@@ -0,0 +1,188 @@
+import argparse
+import asyncio
+import json
+import logging
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+import src.account_module.utils as utils
+from src.account_module.core import PERSONNE_FLOAT_COLS, PERSONNE_INT_COLS, import_epargnes_dataframe, suggestion_epargne_resultats
+from src.account_module.instrumentation import metriques
+from src.account_module.models.tables import EpargneTable, PersonneTable
+
+# Durations covered by the factor table built at startup (longer ones extend it)
+DUREE_MAX_PRECALCULEE = 60
+
+CHAMPS_REQUIS = ['nom'] + [c for c in PERSONNE_FLOAT_COLS + PERSONNE_INT_COLS if c != 'versement_mensuel_utilisateur']
+
+
+def _json_valeur(valeur: Any) -> Any:
+    if isinstance(valeur, float) and math.isnan(valeur):
+        return None
+    if hasattr(valeur, 'item'):
+        return _json_valeur(valeur.item())
+    return valeur
+
+
+class SuggestionService:
+    """
+    Low-latency suggestion service for one client per request.
+
+    The catalogue and its capitalisation factors are loaded once. Requests
+    arriving within `fenetre` seconds of each other (up to `taille_max`)
+    are micro-batched into a single suggestion_epargne_resultats call.
+    """
+
+    def __init__(self, epargnes_df: pd.DataFrame, fenetre: float = 0.002, taille_max: int = 1024):
+        self.epargnes = EpargneTable.from_dataframe(epargnes_df)
+        self.table = utils.TableFacteurs(self.epargnes.taux_interet, DUREE_MAX_PRECALCULEE)
+        self.fenetre = fenetre
+        self.taille_max = taille_max
+        self._file: Optional[asyncio.Queue] = None
+        self._tache: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_fichier(cls, fichier_epargnes: str, **kwargs) -> 'SuggestionService':
+        return cls(import_epargnes_dataframe(fichier_epargnes), **kwargs)
+
+    async def start(self):
+        self._file = asyncio.Queue()
+        self._tache = asyncio.create_task(self._boucle())
+
+    async def stop(self):
+        if self._tache is not None:
+            self._tache.cancel()
+            try:
+                await self._tache
+            except asyncio.CancelledError:
+                pass
+            self._tache = None
+
+    async def suggerer(self, personne: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Suggestion rows (as dicts) for one client given as a JSON-like dict.
+        """
+        if not isinstance(personne, dict):
+            raise TypeError("Le client doit être un objet JSON")
+        manquants = [champ for champ in CHAMPS_REQUIS if personne.get(champ) is None]
+        if manquants:
+            raise ValueError(f"Champs manquants: {', '.join(manquants)}")
+        for champ in PERSONNE_FLOAT_COLS + PERSONNE_INT_COLS:
+            if personne.get(champ) is not None:
+                float(personne[champ])
+        future = asyncio.get_running_loop().create_future()
+        await self._file.put((personne, future))
+        return await future
+
+    async def _boucle(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            lot = [await self._file.get()]
+            echeance = loop.time() + self.fenetre
+            while len(lot) < self.taille_max:
+                reste = echeance - loop.time()
+                if reste <= 0:
+                    break
+                try:
+                    lot.append(await asyncio.wait_for(self._file.get(), reste))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                reponses = await loop.run_in_executor(None, self._calculer, [p for p, _ in lot])
+            except Exception as e:
+                for _, future in lot:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), reponse in zip(lot, reponses):
+                if not future.done():
+                    future.set_result(reponse)
+
+    def _calculer(self, personnes: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        One vectorized computation for a micro-batch of clients.
+        """
+        metriques.incrementer('service.lots')
+        metriques.incrementer('service.requetes', len(personnes))
+        df = utils.clean_dataframe(pd.DataFrame(personnes), float_cols=PERSONNE_FLOAT_COLS,
+                                   int_cols=PERSONNE_INT_COLS, copy=False)
+        resultats = suggestion_epargne_resultats(PersonneTable.from_dataframe(df), self.epargnes, table=self.table)
+        lignes = resultats.to_dataframe().to_dict('records')
+        reponses: List[List[Dict[str, Any]]] = [[] for _ in personnes]
+        for client, ligne in zip(resultats.index_client, lignes):
+            reponses[client].append({cle: _json_valeur(v) for cle, v in ligne.items()})
+        return reponses
+
+
+async def _lire_requete(reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+    methode, chemin, _ = (await reader.readline()).decode('latin-1').split(' ', 2)
+    longueur = 0
+    while True:
+        ligne = (await reader.readline()).decode('latin-1').strip()
+        if not ligne:
+            break
+        nom, _, valeur = ligne.partition(':')
+        if nom.strip().lower() == 'content-length':
+            longueur = int(valeur)
+    corps = await reader.readexactly(longueur) if longueur else b''
+    return methode, chemin, corps
+
+
+async def _repondre(writer: asyncio.StreamWriter, statut: str, donnees: Any):
+    corps = json.dumps(donnees, ensure_ascii=False).encode('utf-8')
+    writer.write(f"HTTP/1.1 {statut}\r\nContent-Type: application/json; charset=utf-8\r\n"
+                 f"Content-Length: {len(corps)}\r\nConnection: close\r\n\r\n".encode('latin-1') + corps)
+    await writer.drain()
+    writer.close()
+
+
+async def serve(service: SuggestionService, host: str = '127.0.0.1', port: int = 8080) -> asyncio.AbstractServer:
+    """
+    Start the HTTP front-end: POST /suggestions with a client as JSON,
+    GET /health. Returns the running asyncio server.
+    """
+    async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            methode, chemin, corps = await _lire_requete(reader)
+            if methode == 'GET' and chemin == '/health':
+                await _repondre(writer, '200 OK', {'statut': 'ok', 'produits': len(service.epargnes)})
+            elif methode == 'POST' and chemin == '/suggestions':
+                try:
+                    resultats = await service.suggerer(json.loads(corps))
+                except (ValueError, TypeError) as e:
+                    await _repondre(writer, '400 Bad Request', {'erreur': str(e)})
+                else:
+                    await _repondre(writer, '200 OK', resultats)
+            else:
+                await _repondre(writer, '404 Not Found', {'erreur': f"{methode} {chemin}"})
+        except Exception as e:
+            logging.error("Erreur service suggestion: %s", e)
+            await _repondre(writer, '500 Internal Server Error', {'erreur': str(e)})
+
+    await service.start()
+    return await asyncio.start_server(handler, host, port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Service HTTP de suggestion d'épargne")
+    parser.add_argument('--epargnes', default='./src/account_module/data/epargnes.csv')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--fenetre', type=float, default=0.002, help="Micro-batching window in seconds")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    async def run():
+        service = SuggestionService.from_fichier(args.epargnes, fenetre=args.fenetre)
+        server = await serve(service, args.host, args.port)
+        logging.info("Service de suggestion à l'écoute sur %s:%d", args.host, args.port)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+import src.account_module.utils as utils
+from src.account_module.core import eligibilite_produits
+from src.account_module.models.epargne import Epargne
+from src.account_module.models.personne import Personne
+from src.account_module.models.tables import EpargneTable, PersonneTable
+
+
+def facteur_net(taux_annuel, fiscalite, duree_annees):
+    """
+    Net final amount per 1 € of monthly deposit, after taxation of the gain.
+
+    suggestion_epargne computes net = 12 * vm * (n + (F - n) * (1 - fiscalite))
+    with F the capitalisation factor, so the net amount is linear in the
+    monthly deposit vm and this is its coefficient. Inputs broadcast.
+    """
+    duree_annees = np.maximum(np.asarray(duree_annees, dtype=float), 0)
+    facteur = utils.facteur_capitalisation_vectorise(taux_annuel, duree_annees)
+    return 12 * (duree_annees + (facteur - duree_annees) * (1 - np.asarray(fiscalite, dtype=float)))
+
+
+def versement_minimal(personne: Personne, epargne: Epargne) -> float:
+    """
+    Minimal monthly deposit for personne to reach its objectif (net of
+    fiscalite) with epargne; inf when no deposit can reach it.
+    """
+    coefficient = float(facteur_net(epargne.taux_interet, epargne.fiscalite, personne.duree_epargne))
+    if personne.objectif <= 0:
+        return 0.0
+    return personne.objectif / coefficient if coefficient > 0 else float('inf')
+
+
+def versements_minimaux(personnes_df: Union[pd.DataFrame, PersonneTable, List[Personne]],
+                        epargnes_df: Union[pd.DataFrame, EpargneTable, List[Epargne]],
+                        table: Optional[utils.TableFacteurs] = None) -> pd.DataFrame:
+    """
+    Minimal monthly deposit reaching each client's objectif, for every
+    eligible product, from the closed-form inverse of the compound-interest
+    formula (no trial runs).
+
+    Eligibility follows suggestion_epargne (duree_min and versement_max).
+    Returns one row per (client, eligible product), in client then product
+    order, with the deposit (rounded up to the cent), its share of the
+    monthly capacity and whether it fits within that capacity.
+    """
+    personnes = PersonneTable.coerce(personnes_df)
+    epargnes = EpargneTable.coerce(epargnes_df)
+
+    _, produit_ok = eligibilite_produits(personnes, epargnes)
+    ci, pi = np.nonzero(produit_ok)
+    duree = personnes.duree_epargne[ci]
+    if table is None:
+        table = utils.TableFacteurs(epargnes.taux_interet, int(personnes.duree_epargne.max()) if len(personnes) else 0)
+    else:
+        table.etendre(int(personnes.duree_epargne.max()) if len(personnes) else 0)
+    facteur = table.facteurs(epargnes.taux_interet[pi], duree)
+    coefficient = 12 * (duree + (facteur - duree) * (1 - epargnes.fiscalite[pi]))
+
+    objectif = personnes.objectif[ci]
+    versement = np.divide(objectif, coefficient, out=np.full(len(ci), np.inf), where=coefficient > 0)
+    versement = np.where(objectif <= 0, 0.0, versement)
+    # Round up to the cent so the exported deposit still reaches the objective
+    versement = np.ceil(np.round(versement * 100, 6)) / 100
+    capacite = personnes.calcul_capacite_epargne()[ci]
+    part = np.divide(versement * 100, capacite, out=np.full(len(ci), np.inf), where=capacite > 0)
+
+    return pd.DataFrame({
+        'nom_client': personnes.nom[ci],
+        'nom_produit': epargnes.nom[pi],
+        'versement_mensuel_minimal': versement,
+        'total_versement': np.round(versement * 12 * duree, 2),
+        'part_capacite': np.round(part, 2),
+        'dans_capacite': versement <= capacite,
+        'taux_interet': epargnes.taux_interet[pi],
+        'fiscalite': epargnes.fiscalite[pi],
+    })
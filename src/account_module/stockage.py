@@ -0,0 +1,173 @@
+import logging
+import sqlite3
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.account_module.instrumentation import metriques
+
+# Product indicators stored once in the produits table
+INDICATEURS_PRODUIT = ['taux_interet', 'fiscalite', 'duree_min', 'versement_max']
+# Per-row columns of the suggestions table (besides the product reference)
+COLONNES_SUGGESTION = ['nom_client', 'scenarios', 'effort_mensuel', 'total_versement',
+                       'montant_net_final', 'atteint_objectif']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS produits (
+    id INTEGER PRIMARY KEY,
+    nom TEXT NOT NULL UNIQUE,
+    taux_interet REAL,
+    fiscalite REAL,
+    duree_min INTEGER,
+    versement_max REAL
+);
+CREATE TABLE IF NOT EXISTS suggestions (
+    nom_client TEXT NOT NULL,
+    scenarios REAL,
+    produit_id INTEGER NOT NULL REFERENCES produits(id),
+    effort_mensuel REAL,
+    total_versement REAL,
+    montant_net_final REAL,
+    atteint_objectif INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_suggestions_client ON suggestions(nom_client);
+CREATE INDEX IF NOT EXISTS idx_suggestions_produit ON suggestions(produit_id, atteint_objectif);
+CREATE INDEX IF NOT EXISTS idx_suggestions_objectif ON suggestions(atteint_objectif);
+"""
+
+
+def _lignes_sql(df: pd.DataFrame) -> List[tuple]:
+    """
+    Rows of df as tuples of Python values, missing values as NULL.
+    """
+    return list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+
+
+class ResultatsSQLite:
+    """
+    SQLite store of suggestion results, with indexed lookups.
+
+    Rows in the layout of ResultatsEpargne.to_dataframe are bulk-inserted
+    with executemany, one transaction per write, in WAL mode. Product
+    indicators are normalized into a produits table referenced by id;
+    other extra columns (rang, Monte-Carlo indicators...) are added to the
+    suggestions table on first sight. nom_client, the product (with
+    atteint_objectif) and atteint_objectif are indexed. Use as a context
+    manager, or as a DataFrameWriter through a .sqlite / .db path.
+    """
+
+    def __init__(self, fichier: str, taille_lot: int = 10_000):
+        self.fichier = fichier
+        self.taille_lot = taille_lot
+        self.lignes = 0
+        self.connexion = sqlite3.connect(fichier)
+        self.connexion.execute('PRAGMA journal_mode=WAL')
+        self.connexion.execute('PRAGMA synchronous=NORMAL')
+        self.connexion.executescript(_SCHEMA)
+        self._produits = dict(self.connexion.execute('SELECT nom, id FROM produits'))
+        self._colonnes = [ligne[1] for ligne in self.connexion.execute('PRAGMA table_info(suggestions)')]
+
+    def _ids_produits(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Ids of the products of df, inserting the new ones.
+        """
+        nouveaux = df.drop_duplicates('nom_produit')
+        nouveaux = nouveaux[~nouveaux['nom_produit'].isin(self._produits)]
+        if len(nouveaux):
+            indicateurs = [col for col in INDICATEURS_PRODUIT if col in df.columns]
+            self.connexion.executemany(
+                f"INSERT INTO produits (nom, {', '.join(indicateurs)}) VALUES ({', '.join('?' * (len(indicateurs) + 1))})",
+                _lignes_sql(nouveaux[['nom_produit'] + indicateurs])
+            )
+            self._produits = dict(self.connexion.execute('SELECT nom, id FROM produits'))
+        return df['nom_produit'].map(self._produits).to_numpy(dtype=np.int64)
+
+    @metriques.chronometre('ecriture')
+    def write(self, df: pd.DataFrame):
+        """
+        Append result rows to the store.
+        """
+        extras = [col for col in df.columns
+                  if col not in COLONNES_SUGGESTION + INDICATEURS_PRODUIT + ['nom_produit']]
+        colonnes = COLONNES_SUGGESTION + extras + ['produit_id']
+        with self.connexion:
+            for col in extras:
+                if col not in self._colonnes:
+                    self.connexion.execute(f'ALTER TABLE suggestions ADD COLUMN "{col}"')
+                    self._colonnes.append(col)
+            donnees = df[COLONNES_SUGGESTION + extras].assign(
+                produit_id=self._ids_produits(df),
+                atteint_objectif=df['atteint_objectif'].astype(bool).astype(int)
+            )
+            noms = ', '.join(f'"{col}"' for col in colonnes)
+            requete = f"INSERT INTO suggestions ({noms}) VALUES ({', '.join('?' * len(colonnes))})"
+            for debut in range(0, len(donnees), self.taille_lot):
+                self.connexion.executemany(requete, _lignes_sql(donnees.iloc[debut:debut + self.taille_lot]))
+        self.lignes += len(df)
+
+    def resultats(self,
+                  nom_client: Optional[str] = None,
+                  nom_produit: Optional[str] = None,
+                  atteint_objectif: Optional[bool] = None) -> pd.DataFrame:
+        """
+        Stored rows matching the given filters, in insertion order and in
+        the layout of ResultatsEpargne.to_dataframe.
+        """
+        conditions, parametres = [], []
+        if nom_client is not None:
+            conditions.append('s.nom_client = ?')
+            parametres.append(nom_client)
+        if nom_produit is not None:
+            conditions.append('s.produit_id = (SELECT id FROM produits WHERE nom = ?)')
+            parametres.append(nom_produit)
+        if atteint_objectif is not None:
+            conditions.append('s.atteint_objectif = ?')
+            parametres.append(int(atteint_objectif))
+        extras = [c for c in self._colonnes if c not in COLONNES_SUGGESTION + ['produit_id']]
+        requete = (
+            "SELECT s.nom_client, s.scenarios, p.nom AS nom_produit, s.effort_mensuel, s.total_versement, "
+            "s.montant_net_final, s.atteint_objectif, "
+            + ', '.join(f'p.{col}' for col in INDICATEURS_PRODUIT)
+            + ''.join(f', s."{col}"' for col in extras)
+            + " FROM suggestions s JOIN produits p ON p.id = s.produit_id"
+            + (" WHERE " + " AND ".join(conditions) if conditions else "")
+            + " ORDER BY s.rowid"
+        )
+        df = pd.read_sql_query(requete, self.connexion, params=parametres)
+        df['atteint_objectif'] = df['atteint_objectif'].astype(bool)
+        return df
+
+    def resultats_client(self, nom_client: str) -> pd.DataFrame:
+        """
+        All stored rows of a client.
+        """
+        return self.resultats(nom_client=nom_client)
+
+    def clients_atteignant(self, nom_produit: str) -> List[str]:
+        """
+        Clients reaching their objectif with the given product, in first-row order.
+        """
+        lignes = self.connexion.execute(
+            "SELECT nom_client FROM suggestions "
+            "WHERE produit_id = (SELECT id FROM produits WHERE nom = ?) AND atteint_objectif = 1 "
+            "GROUP BY nom_client ORDER BY MIN(rowid)",
+            (nom_produit,)
+        )
+        return [nom for (nom,) in lignes]
+
+    def close(self):
+        """
+        Checkpoint the WAL and close the database.
+        """
+        if self.connexion is not None:
+            self.connexion.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            self.connexion.close()
+            self.connexion = None
+            logging.info(f"Base {self.fichier} enregistrée ({self.lignes} lignes)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,27 +1,185 @@
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
 import logging
+import math
 import os
-from typing import List
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from src.account_module.instrumentation import metriques
+
+def facteur_capitalisation(taux_annuel: float, duree_annees: int) -> float:
+    """
+    Final value of 1 € deposited at the start of each year for duree_annees years.
+
+    Closed form of the geometric series (1 + t) * ((1 + t)^n - 1) / t,
+    equal to n when the rate is zero.
+    """
+    if duree_annees <= 0:
+        return 0.0
+    if taux_annuel == 0:
+        return float(duree_annees)
+    return (1 + taux_annuel) * math.expm1(duree_annees * math.log1p(taux_annuel)) / taux_annuel
+
 
 def calcul_interets_composes(versement_annuel: float, taux_annuel: float, duree_annees: int) -> float:
-    montant_final = 0.0
-    for _ in range(duree_annees):
-        montant_final = (montant_final + versement_annuel) * (1 + taux_annuel)
-    return montant_final
+    return versement_annuel * facteur_capitalisation(taux_annuel, duree_annees)
+
+
+def facteur_capitalisation_vectorise(taux_annuel, duree_annees) -> np.ndarray:
+    """
+    Array version of facteur_capitalisation; inputs broadcast like a ufunc.
+    """
+    taux_annuel, duree_annees = np.broadcast_arrays(np.asarray(taux_annuel, dtype=float),
+                                                    np.asarray(duree_annees, dtype=float))
+    duree_annees = np.maximum(duree_annees, 0)
+    nul = taux_annuel == 0
+    taux_safe = np.where(nul, 1.0, taux_annuel)
+    facteur = (1 + taux_safe) * np.expm1(duree_annees * np.log1p(taux_safe)) / taux_safe
+    return np.where(nul, duree_annees, facteur)
+
+
+def calcul_interets_composes_vectorise(versement_annuel, taux_annuel, duree_annees) -> np.ndarray:
+    """
+    Array version of calcul_interets_composes; inputs broadcast like a ufunc.
+    """
+    return np.asarray(versement_annuel, dtype=float) * facteur_capitalisation_vectorise(taux_annuel, duree_annees)
+
+
+class TableFacteurs:
+    """
+    Precomputed capitalisation factors keyed by (taux, duree).
+
+    The compound amount is linear in the deposit, so one factor per
+    (rate, duration) pair serves every client: batch callers build the table
+    once per product catalogue and multiply deposits by looked-up factors.
+    """
+
+    def __init__(self, taux_annuels, duree_max: int):
+        self.taux_annuels = np.unique(np.asarray(taux_annuels, dtype=float))
+        self.duree_max = int(duree_max)
+        self.valeurs = facteur_capitalisation_vectorise(self.taux_annuels[:, None],
+                                                        np.arange(self.duree_max + 1)[None, :])
+
+    def lignes(self, taux_annuel) -> np.ndarray:
+        """
+        Row index of each rate in the table.
+        """
+        taux_annuel = np.asarray(taux_annuel, dtype=float)
+        lignes = np.searchsorted(self.taux_annuels, taux_annuel)
+        lignes = np.minimum(lignes, len(self.taux_annuels) - 1)
+        if len(self.taux_annuels) == 0 or not np.all(self.taux_annuels[lignes] == taux_annuel):
+            raise KeyError("Taux absent de la table des facteurs")
+        return lignes
+
+    def etendre(self, duree_max: int):
+        """
+        Grow the table so it covers durations up to duree_max.
+        """
+        if duree_max > self.duree_max:
+            self.duree_max = int(duree_max)
+            self.valeurs = facteur_capitalisation_vectorise(self.taux_annuels[:, None],
+                                                            np.arange(self.duree_max + 1)[None, :])
+
+    def facteurs(self, taux_annuel, duree_annees) -> np.ndarray:
+        """
+        Factors for aligned (or broadcastable) arrays of rates and durations.
+        """
+        duree_annees = np.maximum(np.asarray(duree_annees, dtype=np.int64), 0)
+        if duree_annees.size and duree_annees.max() > self.duree_max:
+            raise ValueError(f"Durée supérieure à la durée maximale de la table ({self.duree_max})")
+        return self.valeurs[self.lignes(taux_annuel), duree_annees]
+
+    def __getitem__(self, cle: Tuple[float, int]) -> float:
+        taux_annuel, duree_annees = cle
+        return float(self.facteurs(taux_annuel, duree_annees))
+
+# Extensions read by read_dataframe
+EXTENSIONS_LECTURE = ('.csv', '.txt', '.xlsx', '.xls', '.parquet', '.feather')
+# Candidate separators of delimited text files
+SEPARATEURS = (',', '\t', ';')
+
 
-def read_dataframe(fichier: str) -> pd.DataFrame:
+def separateur_csv(fichier: str) -> str:
+    """
+    Separator of a delimited text file, read from its header line.
+
+    The extension gives the default (',' for .csv, tab for .txt); another
+    candidate of SEPARATEURS is used only when the header does not contain
+    the default one, e.g. a tab-separated export named .csv.
+    """
+    defaut = '\t' if fichier.lower().endswith('.txt') else ','
+    with open(fichier, encoding='utf-8', errors='replace') as f:
+        entete = f.readline()
+    if defaut in entete:
+        return defaut
+    nombre, sep = max((entete.count(sep), sep) for sep in SEPARATEURS)
+    return sep if nombre else defaut
+
+
+def lister_fichiers(sources: Union[str, Sequence[str]],
+                    extensions: Sequence[str] = EXTENSIONS_LECTURE) -> List[str]:
+    """
+    Files designated by sources: a directory (its files with one of the
+    extensions), a glob pattern, a file path, or a list of them. Returns
+    sorted paths without duplicates; raises FileNotFoundError when nothing
+    matches.
+    """
+    if isinstance(sources, str):
+        sources = [sources]
+    fichiers = set()
+    for source in sources:
+        if os.path.isdir(source):
+            candidats = [os.path.join(source, nom) for nom in os.listdir(source)]
+        elif glob.has_magic(source):
+            candidats = glob.glob(source)
+        else:
+            candidats = [source] if os.path.exists(source) else []
+        fichiers.update(f for f in candidats
+                        if os.path.isfile(f) and os.path.splitext(f)[1].lower() in extensions)
+    if not fichiers:
+        raise FileNotFoundError(f"Aucun fichier lisible dans {', '.join(sources)}")
+    return sorted(fichiers)
+
+
+def read_dataframe(fichier: str, colonnes: Optional[Sequence[str]] = None) -> pd.DataFrame:
     """
     Read a file into a pandas DataFrame.
+
+    Supports CSV, tab-separated TXT (another separator is detected from
+    the header, see separateur_csv), Excel, and the typed binary formats
+    Parquet and Feather (pyarrow). .xlsx workbooks are streamed with
+    iter_excel, all sheets one after the other. With colonnes, only those
+    columns are parsed (missing ones are ignored).
     """
+    import pandas as pd
+
     ext = os.path.splitext(fichier)[1].lower()
+    usecols = (lambda col: col in colonnes) if colonnes is not None else None
     try:
         if ext in ['.csv', '.txt']:
-            if ext == '.csv':
-                df = pd.read_csv(fichier, sep=',')
-            else:
-                df = pd.read_csv(fichier, sep='\t')
-        elif ext in ['.xlsx', '.xls']:
-            df = pd.read_excel(fichier)
+            df = pd.read_csv(fichier, sep=separateur_csv(fichier), usecols=usecols)
+        elif ext == '.xlsx':
+            chunks = list(iter_excel(fichier, colonnes=colonnes))
+            df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+        elif ext == '.xls':
+            df = pd.read_excel(fichier, usecols=usecols)
+        elif ext == '.parquet':
+            if colonnes is not None:
+                import pyarrow.parquet as pq
+                noms = pq.read_schema(fichier).names
+                colonnes = [col for col in colonnes if col in noms]
+            df = pd.read_parquet(fichier, columns=colonnes)
+        elif ext == '.feather':
+            df = pd.read_feather(fichier)
+            if colonnes is not None:
+                df = df[[col for col in df.columns if col in colonnes]]
         else:
             raise ValueError(f"Format de fichier non supporté: {ext}")
     except Exception as e:
@@ -31,38 +189,190 @@ def read_dataframe(fichier: str) -> pd.DataFrame:
     return df
 
 
+def iter_excel(fichier: str,
+               chunksize: int = 100_000,
+               colonnes: Optional[Sequence[str]] = None,
+               feuilles: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream an .xlsx workbook as DataFrames of at most chunksize rows.
+
+    The workbook is opened read-only (openpyxl), so rows are parsed as
+    they are iterated and memory stays bounded by chunksize. Every sheet,
+    or those named in feuilles, is read in turn with its own header row;
+    blank rows are skipped. With colonnes, only those columns are kept.
+    The index runs on across chunks and sheets, as with read_csv chunks.
+    """
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    classeur = load_workbook(fichier, read_only=True, data_only=True)
+    total = 0
+    try:
+        for feuille in (feuilles if feuilles is not None else classeur.sheetnames):
+            lignes = classeur[feuille].iter_rows(values_only=True)
+            entete = next(lignes, None)
+            if entete is None:
+                continue
+            positions = [i for i, col in enumerate(entete)
+                         if col is not None and (colonnes is None or col in colonnes)]
+            noms = [entete[i] for i in positions]
+            paquet = []
+            for ligne in lignes:
+                valeurs = tuple(ligne[i] if i < len(ligne) else None for i in positions)
+                if all(v is None for v in valeurs):
+                    continue
+                paquet.append(valeurs)
+                if len(paquet) == chunksize:
+                    yield pd.DataFrame.from_records(paquet, columns=noms, index=pd.RangeIndex(total, total + len(paquet)))
+                    total += len(paquet)
+                    paquet = []
+            if paquet:
+                yield pd.DataFrame.from_records(paquet, columns=noms, index=pd.RangeIndex(total, total + len(paquet)))
+                total += len(paquet)
+    finally:
+        classeur.close()
+
+
+def iter_dataframe(fichier: str, chunksize: int, colonnes: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Read a file into successive DataFrames of at most chunksize rows.
+
+    CSV/TXT files are parsed lazily and .xlsx workbooks streamed with
+    iter_excel; legacy .xls has no streaming reader, so the sheet is read
+    once and sliced. With colonnes, only those columns are parsed.
+    """
+    import pandas as pd
+
+    ext = os.path.splitext(fichier)[1].lower()
+    usecols = (lambda col: col in colonnes) if colonnes is not None else None
+    try:
+        if ext in ['.csv', '.txt']:
+            with pd.read_csv(fichier, sep=separateur_csv(fichier), chunksize=chunksize, usecols=usecols) as reader:
+                yield from reader
+        elif ext == '.xlsx':
+            yield from iter_excel(fichier, chunksize=chunksize, colonnes=colonnes)
+        elif ext == '.xls':
+            df = pd.read_excel(fichier, usecols=usecols)
+            for debut in range(0, len(df), chunksize):
+                yield df.iloc[debut:debut + chunksize].copy()
+        else:
+            raise ValueError(f"Format de fichier non supporté: {ext}")
+    except Exception as e:
+        logging.error(f"Erreur lecture fichier {fichier}: {e}")
+        raise
+
+
+def valider_dataframe(df: pd.DataFrame,
+                      float_cols: List[str],
+                      int_cols: List[str],
+                      requis: Sequence[str] = (),
+                      copy: bool = True) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Vectorized validation of a DataFrame: convert float and int columns and
+    split off the invalid rows.
+
+    Each column is cast in one vectorized pass, falling back to
+    pd.to_numeric(errors='coerce') when some values do not parse. Empty
+    values (None, 'None', '', NaN) stay missing; values that do not parse,
+    int values with a fractional part and missing values in requis
+    columns invalidate their row. Returns the valid rows, converted, and
+    the rejected rows with their original values plus 'ligne' (their index
+    in df) and 'motif' columns.
+
+    Pass copy=False when the caller owns df (e.g. a freshly read chunk)
+    to convert its columns in place.
+    """
+    import pandas as pd
+
+    if copy:
+        df = df.copy()
+    originaux: Dict[str, pd.Series] = {}
+    erreurs: List[Tuple[np.ndarray, str]] = []
+    for col, entier in [(c, False) for c in float_cols] + [(c, True) for c in int_cols]:
+        if col not in df.columns:
+            continue
+        brut = df[col]
+        vide = brut.isna()
+        if pd.api.types.is_numeric_dtype(brut):
+            converti = brut
+        else:
+            vide = vide | brut.isin(['None', ''])
+            try:
+                # Fast path: the whole column parses
+                converti = brut.mask(vide).astype(float)
+            except (TypeError, ValueError):
+                converti = pd.to_numeric(brut.mask(vide), errors='coerce')
+        invalide = (converti.isna() & ~vide).to_numpy(dtype=bool)
+        if entier:
+            invalide = invalide | (converti.notna() & (converti % 1 != 0)).to_numpy(dtype=bool, na_value=False)
+        if invalide.any():
+            erreurs.append((invalide, f"{col}: valeur invalide"))
+            converti = converti.mask(invalide)
+        if col in requis:
+            manquant = vide.to_numpy(dtype=bool)
+            if manquant.any():
+                erreurs.append((manquant, f"{col}: valeur manquante"))
+        originaux[col] = brut
+        df[col] = converti.astype('Int64' if entier else float)
+    for col in requis:
+        if col in df.columns and col not in originaux:
+            manquant = df[col].isna().to_numpy(dtype=bool)
+            if manquant.any():
+                erreurs.append((manquant, f"{col}: valeur manquante"))
+
+    rejete = np.zeros(len(df), dtype=bool)
+    for masque, _ in erreurs:
+        rejete |= masque
+    rejets = pd.DataFrame({col: originaux.get(col, df[col])[rejete] for col in df.columns})
+    rejets.insert(0, 'ligne', df.index[rejete])
+    motifs = np.full(len(rejets), '', dtype=object)
+    for masque, motif in erreurs:
+        motifs[masque[rejete]] += '; ' + motif
+    rejets['motif'] = [m[2:] for m in motifs]
+    if rejete.any():
+        df = df[~rejete]
+    return df, rejets
+
+
 def clean_dataframe(df: pd.DataFrame,
-                     float_cols: List[str],
-                     int_cols: List[str]) -> pd.DataFrame:
+                    float_cols: List[str],
+                    int_cols: List[str],
+                    copy: bool = True,
+                    requis: Sequence[str] = (),
+                    rejets: Optional[Union[str, 'DataFrameWriter']] = None) -> pd.DataFrame:
     """
     Clean a DataFrame by converting specified columns to float or int.
+
+    Conversion and checks are those of valider_dataframe. By default any
+    invalid row raises a ValueError; with rejets (a file path, or an open
+    DataFrameWriter when cleaning chunk by chunk) invalid rows are written
+    there with their reasons and the valid rows are returned.
+
+    Pass copy=False when the caller owns df (e.g. a freshly read chunk)
+    to convert its columns in place.
     """
-    df = df.copy()
-    # Nettoyage float
-    for col in float_cols:
-        if col in df.columns:
-            df[col] = df[col].replace(['None', None], pd.NA)
-            try:
-                df[col] = df[col].astype(float)
-            except Exception as e:
-                logging.error(f"Conversion en float impossible pour la colonne '{col}': {e}")
-                raise ValueError(f"Format invalide pour {col}")
-    # Nettoyage int
-    for col in int_cols:
-        if col in df.columns:
-            df[col] = df[col].replace(['None', None], pd.NA)
-            try:
-                # Utilise Int64 pour permettre les NaN
-                df[col] = df[col].astype('Int64')
-            except Exception as e:
-                logging.error(f"Conversion en int impossible pour la colonne '{col}': {e}")
-                raise ValueError(f"Format invalide pour {col}")
+    df, invalides = valider_dataframe(df, float_cols=float_cols, int_cols=int_cols, requis=requis, copy=copy)
+    if len(invalides) and rejets is None:
+        ligne, motif = invalides['ligne'].iloc[0], invalides['motif'].iloc[0]
+        logging.error("%d lignes invalides, la première (ligne %s): %s", len(invalides), ligne, motif)
+        raise ValueError(f"Format invalide à la ligne {ligne}: {motif}")
+    if isinstance(rejets, DataFrameWriter):
+        if len(invalides):
+            rejets.write(invalides)
+    elif rejets is not None:
+        write_dataframe(invalides, rejets)
+    if len(invalides):
+        metriques.incrementer('lignes_rejetees', len(invalides))
+        logging.warning("%d lignes invalides écartées", len(invalides))
     return df
 
 
 def write_dataframe(df: pd.DataFrame, fichier: str):
     """
     Write a DataFrame to a file in the appropriate format based on the file extension.
+
+    Parquet and Feather (pyarrow) keep the column dtypes, so cleaned frames
+    reload without another clean_dataframe pass.
     """
     ext = os.path.splitext(fichier)[1].lower()
     try:
@@ -71,11 +381,191 @@ def write_dataframe(df: pd.DataFrame, fichier: str):
                 df.to_csv(fichier, index=False)
             else:
                 df.to_csv(fichier, sep='\t', index=False)
-        elif ext in ['.xlsx', '.xls']:
+        elif ext in ['.xlsx', '.sqlite', '.db']:
+            with DataFrameWriter(fichier) as writer:
+                writer.write(df)
+            return
+        elif ext == '.xls':
             df.to_excel(fichier, index=False)
+        elif ext == '.parquet':
+            df.to_parquet(fichier, index=False)
+        elif ext == '.feather':
+            df.reset_index(drop=True).to_feather(fichier)
         else:
             raise ValueError(f"Format de fichier non supporté: {ext}")
     except Exception as e:
         logging.error(f"Erreur écriture fichier {fichier}: {e}")
         raise
-    logging.info(f"Fichier {fichier} enregistré ({len(df)} lignes)")
\ No newline at end of file
+    logging.info(f"Fichier {fichier} enregistré ({len(df)} lignes)")
+
+
+def empreintes_lignes(df: pd.DataFrame, colonnes: List[str]) -> np.ndarray:
+    """
+    Stable 64-bit fingerprint of each row over the given columns (missing
+    columns are ignored), identical from one run to the next.
+    """
+    import pandas as pd
+
+    colonnes = [col for col in colonnes if col in df.columns]
+    return pd.util.hash_pandas_object(df[colonnes], index=False).to_numpy()
+
+
+def _signature_fichier(fichier: str) -> Dict[str, int]:
+    stat = os.stat(fichier)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def _hash_fichier(fichier: str) -> str:
+    sha = hashlib.sha256()
+    with open(fichier, 'rb') as f:
+        for bloc in iter(lambda: f.read(1 << 20), b''):
+            sha.update(bloc)
+    return sha.hexdigest()
+
+
+def read_cached_dataframe(source: str,
+                          cache: str,
+                          float_cols: List[str],
+                          int_cols: List[str],
+                          requis: Sequence[str] = (),
+                          rejets: Optional[str] = None) -> pd.DataFrame:
+    """
+    Read and clean source through a typed binary cache (.parquet or .feather).
+
+    A sidecar <cache>.json records the source mtime, size and SHA-256. The
+    cache is reused while mtime and size are unchanged; otherwise the source
+    is hashed, and the cache is rebuilt only if its content changed. The
+    cache holds the valid rows only: rejets, if given, is written when the
+    cache is rebuilt.
+    """
+    if os.path.splitext(cache)[1].lower() not in ['.parquet', '.feather']:
+        raise ValueError(f"Format de cache non supporté: {cache}")
+    meta_fichier = cache + '.json'
+    signature = _signature_fichier(source)
+    meta = None
+    if os.path.exists(cache) and os.path.exists(meta_fichier):
+        with open(meta_fichier) as f:
+            meta = json.load(f)
+
+    if meta is not None and meta.get('source') == os.path.abspath(source):
+        if all(meta.get(k) == v for k, v in signature.items()):
+            return read_dataframe(cache)
+        empreinte = _hash_fichier(source)
+        if meta.get('sha256') == empreinte:
+            meta.update(signature)
+            with open(meta_fichier, 'w') as f:
+                json.dump(meta, f)
+            return read_dataframe(cache)
+    else:
+        empreinte = _hash_fichier(source)
+
+    logging.info(f"Cache {cache} absent ou périmé, nettoyage de {source}")
+    df = clean_dataframe(read_dataframe(source), float_cols=float_cols, int_cols=int_cols, copy=False,
+                         requis=requis, rejets=rejets)
+    write_dataframe(df, cache)
+    with open(meta_fichier, 'w') as f:
+        json.dump({'source': os.path.abspath(source), 'sha256': empreinte, **signature}, f)
+    return df
+
+
+class DataFrameWriter:
+    """
+    Append DataFrames to a single file, chunk after chunk.
+
+    CSV/TXT chunks are appended under one header line; Parquet chunks are
+    written as row groups (requires pyarrow); .xlsx rows are streamed to a
+    write-only openpyxl workbook, continuing on a new sheet (with its own
+    header) when one is full, and the workbook is saved on close;
+    .sqlite / .db paths get a fresh stockage.ResultatsSQLite (suggestion
+    results only). Use as a context manager.
+    """
+
+    # Data rows per sheet: Excel's 1,048,576 rows minus the header
+    LIGNES_MAX_EXCEL = 1_048_575
+
+    def __init__(self, fichier: str):
+        self.fichier = fichier
+        self.ext = os.path.splitext(fichier)[1].lower()
+        if self.ext not in ['.csv', '.txt', '.parquet', '.xlsx', '.sqlite', '.db']:
+            raise ValueError(f"Format de fichier non supporté en écriture incrémentale: {self.ext}")
+        self.lignes = 0
+        self._debut = True
+        self._parquet = None
+        self._sqlite = None
+        if self.ext in ['.sqlite', '.db']:
+            from src.account_module.stockage import ResultatsSQLite
+            for chemin in [fichier, fichier + '-wal', fichier + '-shm']:
+                if os.path.exists(chemin):
+                    os.remove(chemin)
+            self._sqlite = ResultatsSQLite(fichier)
+        self._classeur = None
+        self._feuille = None
+        self._lignes_feuille = 0
+
+    @metriques.chronometre('ecriture')
+    def write(self, df: pd.DataFrame):
+        """
+        Append df to the file.
+        """
+        try:
+            if self.ext == '.parquet':
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                if self._parquet is None:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    self._parquet = pq.ParquetWriter(self.fichier, table.schema)
+                else:
+                    table = pa.Table.from_pandas(df, schema=self._parquet.schema, preserve_index=False)
+                self._parquet.write_table(table)
+            elif self.ext == '.xlsx':
+                self._write_excel(df)
+            elif self._sqlite is not None:
+                self._sqlite.write(df)
+            else:
+                sep = ',' if self.ext == '.csv' else '\t'
+                df.to_csv(self.fichier, sep=sep, index=False,
+                          mode='w' if self._debut else 'a', header=self._debut)
+        except Exception as e:
+            logging.error(f"Erreur écriture fichier {self.fichier}: {e}")
+            raise
+        self._debut = False
+        self.lignes += len(df)
+
+    def _write_excel(self, df: pd.DataFrame):
+        if self._classeur is None:
+            from openpyxl import Workbook
+            self._classeur = Workbook(write_only=True)
+            self._colonnes = [str(col) for col in df.columns]
+        # Missing values become empty cells
+        valeurs = df.astype(object).where(df.notna(), None)
+        for ligne in valeurs.itertuples(index=False, name=None):
+            if self._feuille is None or self._lignes_feuille == self.LIGNES_MAX_EXCEL:
+                self._feuille = self._classeur.create_sheet(f"Feuille{len(self._classeur.sheetnames) + 1}")
+                self._feuille.append(self._colonnes)
+                self._lignes_feuille = 0
+            self._feuille.append(ligne)
+            self._lignes_feuille += 1
+
+    def close(self):
+        """
+        Flush and close the file.
+        """
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+        if self._sqlite is not None:
+            self._sqlite.close()
+            self._sqlite = None
+        if self._classeur is not None:
+            if self._feuille is None:
+                self._classeur.create_sheet("Feuille1").append(self._colonnes)
+            self._classeur.save(self.fichier)
+            self._classeur = None
+        logging.info(f"Fichier {self.fichier} enregistré ({self.lignes} lignes)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.account_module.allocation import allocation_epargne
+from src.account_module.solveur import facteur_net
+
+@pytest.fixture
+def epargnes():
+  return pd.DataFrame({
+    "nom": ["Livret A", "PEL", "PEA"],
+    "taux_interet": [0.03, 0.02, 0.06],
+    "fiscalite": [0.0, 0.3, 0.172],
+    "duree_min": [0, 4, 5],
+    "versement_max": [22950.0, 61200.0, None],
+  })
+
+def personnes(objectif, duree, revenu=60000.0):
+  # Capacity: revenu / 12 - loyer - depenses_mensuelles = 5000 - 1000 - 1500 = 2500
+  return pd.DataFrame({
+    "nom": ["A"],
+    "age": [40],
+    "revenu_annuel": [revenu],
+    "loyer": [1000.0],
+    "depenses_mensuelles": [1500.0],
+    "objectif": [objectif],
+    "duree_epargne": [duree],
+    "versement_mensuel_utilisateur": [0.0],
+  })
+
+def glouton(personne, epargnes):
+  # Reference: one greedy loop for a single client
+  duree = int(personne["duree_epargne"])
+  capacite = personne["revenu_annuel"] / 12 - personne["loyer"] - personne["depenses_mensuelles"]
+  reste = personne["objectif"]
+  produits = []
+  for e in epargnes.itertuples():
+    if duree >= e.duree_min:
+      coefficient = float(facteur_net(e.taux_interet, e.fiscalite, duree))
+      plafond = np.inf if pd.isna(e.versement_max) else e.versement_max / (12 * duree)
+      produits.append((coefficient, e.nom, plafond))
+  plan = []
+  for coefficient, nom, plafond in sorted(produits, key=lambda p: -p[0]):
+    versement = min(plafond, capacite, reste / coefficient)
+    if versement <= 0:
+      break
+    plan.append((nom, versement))
+    capacite -= versement
+    reste -= versement * coefficient
+  return plan
+
+def test_short_duration_fills_capped_products_in_yield_order(epargnes):
+  # PEA is not open for 4 years; Livret A (best net yield) is capped
+  plan = allocation_epargne(personnes(60000.0, 4), epargnes)
+  assert plan["nom_produit"].tolist() == ["Livret A", "PEL"]
+  assert plan["plafond_atteint"].tolist() == [True, False]
+  assert plan["total_versement"].iloc[0] == pytest.approx(22950.0)
+  assert plan["montant_net_final"].sum() == pytest.approx(60000.0, abs=0.02)
+  assert plan["atteint_objectif"].all()
+
+def test_objective_out_of_reach_uses_whole_capacity(epargnes):
+  plan = allocation_epargne(personnes(10_000_000.0, 10), epargnes)
+  assert plan["versement_mensuel"].sum() == pytest.approx(2500.0)
+  assert not plan["atteint_objectif"].any()
+  assert plan["nom_produit"].iloc[0] == "PEA"
+
+@pytest.mark.parametrize("objectif,duree", [(30000.0, 3), (60000.0, 4), (150000.0, 6), (400000.0, 12), (0.0, 5)])
+def test_matches_per_client_greedy(epargnes, objectif, duree):
+  df = personnes(objectif, duree)
+  plan = allocation_epargne(df, epargnes)
+  attendu = glouton(df.iloc[0], epargnes)
+  assert plan["nom_produit"].tolist() == [nom for nom, _ in attendu]
+  np.testing.assert_allclose(plan["versement_mensuel"], [round(v, 2) for _, v in attendu], atol=0.01)
+
+def test_portfolio_runs_as_one_batch(epargnes):
+  df = pd.concat([personnes(60000.0, 4), personnes(150000.0, 6).assign(nom="B")], ignore_index=True)
+  plan = allocation_epargne(df, epargnes)
+  for nom, objectif, duree in [("A", 60000.0, 4), ("B", 150000.0, 6)]:
+    seul = allocation_epargne(personnes(objectif, duree), epargnes)
+    lignes = plan[plan["nom_client"] == nom].drop(columns="nom_client").reset_index(drop=True)
+    pd.testing.assert_frame_equal(lignes, seul.drop(columns="nom_client"))
@@ -0,0 +1,49 @@
+import pytest
+from src.account_module.cache import SuggestionCache
+from src.account_module.core import suggestion_epargne
+from src.account_module.models.personne import Personne
+from src.account_module.models.epargne import Epargne
+
+def make_personne(nom, objectif=10000.0):
+  return Personne(nom=nom, age=30, revenu_annuel=36000.0, loyer=800.0, depenses_mensuelles=500.0,
+                  objectif=objectif, duree_epargne=5, versement_mensuel_utilisateur=200.0)
+
+@pytest.fixture
+def epargnes():
+  return [
+    Epargne(nom="Livret A", taux_interet=0.024, fiscalite=0.0, duree_min=0, versement_max=22950.0),
+    Epargne(nom="PEL", taux_interet=0.0175, fiscalite=0.3, duree_min=4, versement_max=61200.0),
+  ]
+
+def test_cache_reuses_rows_across_names(epargnes):
+  cache = SuggestionCache(maxsize=10)
+  alice = suggestion_epargne(make_personne("Alice"), epargnes, cache=cache)
+  bob = suggestion_epargne(make_personne("Bob"), epargnes, cache=cache)
+  assert cache.stats()["hits"] == 1
+  assert cache.stats()["misses"] == 1
+  assert [r.nom_client for r in bob] == ["Bob"] * len(alice)
+  assert [(r.nom_produit, r.montant_net_final, r.indicateurs) for r in bob] == \
+    [(r.nom_produit, r.montant_net_final, r.indicateurs) for r in alice]
+  bob[0].indicateurs["taux_interet"] = 1.0
+  assert suggestion_epargne(make_personne("Claire"), epargnes, cache=cache)[0].indicateurs["taux_interet"] == 0.024
+
+def test_cache_misses_on_catalogue_change(epargnes):
+  cache = SuggestionCache()
+  suggestion_epargne(make_personne("Alice"), epargnes, cache=cache)
+  epargnes[0].taux_interet = 0.03
+  resultats = suggestion_epargne(make_personne("Alice"), epargnes, cache=cache)
+  assert cache.stats()["misses"] == 2
+  assert resultats[0].indicateurs["taux_interet"] == 0.03
+
+def test_cache_lru_eviction(epargnes):
+  cache = SuggestionCache(maxsize=2)
+  for objectif in (1000.0, 2000.0, 1000.0, 3000.0, 2000.0):
+    suggestion_epargne(make_personne("Alice", objectif), epargnes, cache=cache)
+  stats = cache.stats()
+  assert stats["size"] == 2
+  assert stats["evictions"] == 2
+  assert (stats["hits"], stats["misses"]) == (1, 4)
+
+def test_cache_rejects_invalid_size():
+  with pytest.raises(ValueError):
+    SuggestionCache(maxsize=0)
@@ -0,0 +1,36 @@
+import random
+from src.account_module.catalogue import EpargneCatalogue
+from src.account_module.core import import_epargnes, import_personnes, suggestion_epargne
+from src.account_module.models.epargne import Epargne
+
+def brute_force(epargnes, duree, objectif):
+  return [e for e in epargnes if duree >= e.duree_min and not objectif > e.versement_max]
+
+def test_eligibles_matches_full_scan():
+  rng = random.Random(0)
+  epargnes = [
+    Epargne(nom=f"P{i}", taux_interet=0.02, fiscalite=0.0, duree_min=rng.randint(0, 15),
+            versement_max=rng.choice([None, float("nan"), rng.uniform(1000, 300000)]))
+    for i in range(500)
+  ]
+  catalogue = EpargneCatalogue(epargnes)
+  for _ in range(200):
+    duree = rng.randint(0, 20)
+    objectif = rng.uniform(0, 350000)
+    assert catalogue.eligibles(duree, objectif) == brute_force(epargnes, duree, objectif)
+
+def test_eligibles_boundaries():
+  epargnes = [
+    Epargne(nom="Livret A", taux_interet=0.024, fiscalite=0.0, duree_min=0, versement_max=22950.0),
+    Epargne(nom="PEL", taux_interet=0.0175, fiscalite=0.3, duree_min=4, versement_max=61200.0),
+  ]
+  catalogue = EpargneCatalogue(epargnes)
+  assert [e.nom for e in catalogue.eligibles(4, 22950.0)] == ["Livret A", "PEL"]
+  assert [e.nom for e in catalogue.eligibles(3, 22950.01)] == []
+  assert len(catalogue) == 2
+
+def test_suggestion_epargne_with_catalogue_matches_list():
+  epargnes = import_epargnes("src/account_module/data/epargnes.csv")
+  catalogue = EpargneCatalogue(epargnes)
+  for personne in import_personnes("src/account_module/data/personnes.csv"):
+    assert suggestion_epargne(personne, catalogue) == suggestion_epargne(personne, epargnes)
@@ -7,7 +7,7 @@ from src.account_module.models.resultat import ResultatEpargne
 
 @pytest.fixture
 def mock_personne():
-  # Mock Personne with calcul_capacite_epargne method
+  # Personne with calcul_capacite_epargne mocked (instances use __slots__, so patch the class)
   p = Personne(
     nom="Alice",
     age=30,
@@ -18,8 +18,8 @@ def mock_personne():
     duree_epargne=5,
     versement_mensuel_utilisateur=200
   )
-  p.calcul_capacite_epargne = MagicMock(return_value=500)
-  return p
+  with patch.object(Personne, "calcul_capacite_epargne", MagicMock(return_value=500)):
+    yield p
 
 @pytest.fixture
 def mock_epargnes():
@@ -95,3 +95,244 @@ def test_suggestion_epargne_zero_versement_max(mock_calc, mock_personne, mock_ep
   # Should still return results for the other product
   assert len(resultats) == 5
   assert all(r.nom_produit == "PEL" for r in resultats)
+
+def test_suggestion_epargne_batch_matches_per_person():
+  from src.account_module.core import (
+    import_personnes, import_epargnes, import_personnes_dataframe, import_epargnes_dataframe, suggestion_epargne_batch
+  )
+  import pandas as pd
+
+  personnes_file = "src/account_module/data/personnes.csv"
+  epargnes_file = "src/account_module/data/epargnes.csv"
+  personnes = import_personnes(personnes_file)
+  epargnes = import_epargnes(epargnes_file)
+  expected = pd.concat(
+    [r.to_dataframe() for p in personnes for r in suggestion_epargne(p, epargnes)],
+    ignore_index=True
+  )
+
+  batch = suggestion_epargne_batch(import_personnes_dataframe(personnes_file), import_epargnes_dataframe(epargnes_file))
+
+  pd.testing.assert_frame_equal(batch, expected, check_dtype=False)
+
+def test_suggestion_epargne_batch_edge_cases():
+  from src.account_module.core import suggestion_epargne_batch
+  import pandas as pd
+
+  personnes_df = pd.DataFrame({
+    'nom': ["Sans versement", "Capacite negative"],
+    'age': [30, 40],
+    'revenu_annuel': [36000.0, 12000.0],
+    'loyer': [800.0, 900.0],
+    'depenses_mensuelles': [500.0, 400.0],
+    'objectif': [5000.0, 5000.0],
+    'duree_epargne': [5, 2],
+    'versement_mensuel_utilisateur': [None, 50.0],
+  })
+  epargnes_df = pd.DataFrame({
+    'nom': ["Livret", "PEL"],
+    'taux_interet': [0.0, 0.02],
+    'fiscalite': [0.0, 0.3],
+    'duree_min': [0, 4],
+    'versement_max': [None, 61000.0],
+  })
+  batch = suggestion_epargne_batch(personnes_df, epargnes_df)
+  # 2 products * 4 scenarios, then 1 eligible product * 5 scenarios
+  assert list(batch['nom_client'].value_counts().sort_index()) == [5, 8]
+  negative = batch[batch['nom_client'] == "Capacite negative"]
+  assert (negative['scenarios'] == 0).all()
+  assert (negative['montant_net_final'] >= 0).all()
+  livret = batch[(batch['nom_client'] == "Sans versement") & (batch['nom_produit'] == "Livret")]
+  assert livret['montant_net_final'].tolist() == livret['total_versement'].tolist()
+
+def test_iter_personnes_matches_import():
+  from src.account_module.core import import_personnes, iter_personnes
+
+  fichier = "src/account_module/data/personnes.csv"
+  expected = import_personnes(fichier)
+  streamed = list(iter_personnes(fichier, chunksize=7))
+  assert [repr(p) for p in streamed] == [repr(p) for p in expected]
+
+  batches = list(iter_personnes(fichier, chunksize=7, batches=True))
+  assert [len(b) for b in batches] == [7, 7, 7, 7, 2]
+  assert str(batches[0]['duree_epargne'].dtype) == 'Int64'
+  assert batches[-1].index[0] == 28
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet"])
+def test_export_suggestions_epargne_streams_chunks(tmp_path, extension):
+  from src.account_module.core import (
+    export_suggestions_epargne, import_personnes_dataframe, import_epargnes_dataframe, suggestion_epargne_batch
+  )
+  import pandas as pd
+  if extension == ".parquet":
+    pytest.importorskip("pyarrow")
+
+  personnes_file = "src/account_module/data/personnes.csv"
+  epargnes_file = "src/account_module/data/epargnes.csv"
+  sortie = tmp_path / f"suggestions{extension}"
+  lignes = export_suggestions_epargne(personnes_file, epargnes_file, str(sortie), chunksize=4)
+
+  expected = suggestion_epargne_batch(import_personnes_dataframe(personnes_file), import_epargnes_dataframe(epargnes_file))
+  written = pd.read_csv(sortie) if extension == ".csv" else pd.read_parquet(sortie)
+  assert lignes == len(expected)
+  pd.testing.assert_frame_equal(written, expected, check_dtype=False)
+
+def test_export_suggestions_epargne_parallel_keeps_order(tmp_path):
+  from src.account_module.core import export_suggestions_epargne
+  import pandas as pd
+
+  personnes_file = "src/account_module/data/personnes.csv"
+  epargnes_file = "src/account_module/data/epargnes.csv"
+  serie = tmp_path / "serie.csv"
+  parallele = tmp_path / "parallele.csv"
+  export_suggestions_epargne(personnes_file, epargnes_file, str(serie), chunksize=3)
+  lignes = export_suggestions_epargne(personnes_file, epargnes_file, str(parallele), chunksize=3, workers=2)
+
+  assert lignes == len(pd.read_csv(serie))
+  assert parallele.read_text() == serie.read_text()
+
+def test_suggestion_epargne_resultats_views_match_per_person():
+  from src.account_module.core import (
+    import_personnes, import_epargnes, import_personnes_dataframe, import_epargnes_dataframe, suggestion_epargne_resultats
+  )
+  personnes_file = "src/account_module/data/personnes.csv"
+  epargnes_file = "src/account_module/data/epargnes.csv"
+  epargnes = import_epargnes(epargnes_file)
+  expected = [r for p in import_personnes(personnes_file) for r in suggestion_epargne(p, epargnes)]
+  resultats = suggestion_epargne_resultats(import_personnes_dataframe(personnes_file), import_epargnes_dataframe(epargnes_file))
+
+  assert len(resultats) == len(expected)
+  for view, ref in zip(resultats, expected):
+    assert (view.nom_client, view.nom_produit, view.scenarios, view.atteint_objectif) == \
+      (ref.nom_client, ref.nom_produit, ref.scenarios, ref.atteint_objectif)
+    assert view.montant_net_final == pytest.approx(ref.montant_net_final, rel=1e-12)
+    assert view.indicateurs.keys() == ref.indicateurs.keys()
+
+def test_export_suggestions_incremental_matches_full_run(tmp_path):
+  from src.account_module.core import export_suggestions_epargne, export_suggestions_incremental
+  import pandas as pd
+
+  personnes = pd.read_csv("src/account_module/data/personnes.csv")
+  epargnes = pd.read_csv("src/account_module/data/epargnes.csv")
+  personnes_file = tmp_path / "personnes.csv"
+  epargnes_file = tmp_path / "epargnes.csv"
+  sortie = tmp_path / "suggestions.csv"
+  personnes.to_csv(personnes_file, index=False)
+  epargnes.to_csv(epargnes_file, index=False)
+  premier = export_suggestions_incremental(str(personnes_file), str(epargnes_file), str(sortie))
+  assert premier["clients_recalcules"] == len(personnes)
+
+  # One product rate, one client objective, one client removed, one added
+  epargnes.loc[0, "taux_interet"] += 0.005
+  personnes.loc[3, "objectif"] += 1000
+  nouveau = personnes.iloc[[5]].assign(nom="Nouveau client")
+  personnes = pd.concat([personnes.drop(index=7), nouveau], ignore_index=True)
+  personnes.to_csv(personnes_file, index=False)
+  epargnes.to_csv(epargnes_file, index=False)
+  recalcul = export_suggestions_incremental(str(personnes_file), str(epargnes_file), str(sortie))
+  assert recalcul["clients_recalcules"] == 2
+  assert recalcul["produits_recalcules"] == 1
+
+  complet = tmp_path / "complet.csv"
+  export_suggestions_epargne(str(personnes_file), str(epargnes_file), str(complet))
+  assert recalcul["lignes"] == len(pd.read_csv(complet))
+  assert sortie.read_text() == complet.read_text()
+
+  # Nothing changed: nothing recomputed
+  assert export_suggestions_incremental(str(personnes_file), str(epargnes_file), str(sortie))["clients_recalcules"] == 0
+  assert sortie.read_text() == complet.read_text()
+
+def test_import_personnes_skips_invalid_rows(tmp_path):
+  from src.account_module.core import import_personnes, iter_personnes
+  import pandas as pd
+
+  source = tmp_path / "personnes.csv"
+  source.write_text(
+    "nom,age,revenu_annuel,loyer,depenses_mensuelles,versement_mensuel_utilisateur,objectif,duree_epargne\n"
+    "Alice,22,21000,400,300,395.0,186000.0,36\n"
+    "Bob,trente,32000,800,500,545.0,104000.0,6\n"
+    "Chloe,40,28000,700,450,,50000.0,\n"
+    "Dan,50,45000,900,600,100.0,90000.0,10\n"
+  )
+  with pytest.raises(ValueError):
+    import_personnes(str(source))
+
+  rejets = tmp_path / "rejets.csv"
+  personnes = import_personnes(str(source), rejets=str(rejets))
+  assert [p.nom for p in personnes] == ["Alice", "Dan"]
+  assert isinstance(personnes[0].age, int) and isinstance(personnes[0].loyer, float)
+  ecartees = pd.read_csv(rejets)
+  assert ecartees["nom"].tolist() == ["Bob", "Chloe"]
+  assert ecartees["motif"].tolist() == ["age: valeur invalide", "duree_epargne: valeur manquante"]
+
+  flux = tmp_path / "rejets_flux.csv"
+  assert [p.nom for p in iter_personnes(str(source), chunksize=2, rejets=str(flux))] == ["Alice", "Dan"]
+  pd.testing.assert_frame_equal(pd.read_csv(flux), ecartees)
+
+def test_import_personnes_from_excel_matches_csv(tmp_path):
+  pytest.importorskip("openpyxl")
+  from src.account_module.core import import_personnes, iter_personnes
+  from src.account_module import utils
+
+  source = "src/account_module/data/personnes.csv"
+  classeur = str(tmp_path / "personnes.xlsx")
+  utils.write_dataframe(utils.read_dataframe(source).assign(agence="Paris"), classeur)
+  attendu = [repr(p) for p in import_personnes(source)]
+  assert [repr(p) for p in import_personnes(classeur)] == attendu
+  assert [repr(p) for p in iter_personnes(classeur, chunksize=7)] == attendu
+
+def test_scalar_path_does_not_import_pandas():
+  import subprocess
+  import sys
+
+  # Fresh interpreter: pandas is loaded by other tests in this one
+  code = "\n".join([
+    "import logging, sys",
+    "from src.account_module.core import suggestion_epargne",
+    "from src.account_module.models.epargne import Epargne",
+    "from src.account_module.models.personne import Personne",
+    "from src.account_module.utils import calcul_interets_composes",
+    "personne = Personne('Alice', 30, 42000.0, 900.0, 1200.0, 20000.0, 10, 200.0)",
+    "assert suggestion_epargne(personne, [Epargne('Livret A', 0.03, 0.0, 1, 22950.0)])",
+    "assert calcul_interets_composes(1200.0, 0.03, 10) > 12000",
+    "assert not logging.getLogger().handlers",
+    "print('pandas' in sys.modules)",
+  ])
+  sortie = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+  assert sortie.stdout.strip() == "False"
+
+def test_import_personnes_sources_merges_mixed_files(tmp_path):
+  pytest.importorskip("openpyxl")
+  import pandas as pd
+  from src.account_module import utils
+  from src.account_module.core import PERSONNE_COLONNES, import_personnes_dataframe, import_personnes_sources
+
+  source = "src/account_module/data/personnes.csv"
+  df = utils.read_dataframe(source)
+  # Same clients with other column orders, extra columns and separators
+  utils.write_dataframe(df, str(tmp_path / "a_agence.csv"))
+  utils.write_dataframe(df.iloc[::-1].assign(agence="Lyon")[["agence"] + list(df.columns[::-1])],
+                        str(tmp_path / "b_agence.xlsx"))
+  nouveaux = df.iloc[:2].assign(nom=["Zoe", "Alice"], age=[40, 23])
+  nouveaux[list(df.columns[::-1])].to_csv(tmp_path / "c_agence.txt", sep=";", index=False)
+
+  consolide = import_personnes_sources(str(tmp_path), workers=2)
+  assert list(consolide.columns) == PERSONNE_COLONNES
+  assert len(consolide) == len(df) + 1
+  assert consolide["nom"].is_unique
+  # The last file wins for duplicated clients
+  assert consolide.set_index("nom").loc["Alice", "age"] == 23
+  attendu = import_personnes_dataframe(source)[PERSONNE_COLONNES].set_index("nom")
+  pd.testing.assert_frame_equal(consolide.set_index("nom").loc[attendu.index[1:]], attendu.iloc[1:],
+                                check_dtype=False)
+
+  (tmp_path / "d_agence.csv").write_text("duree_epargne,nom,age\n10,Yann,trente\n5,Xavier,31\n")
+  with pytest.raises(ValueError, match="d_agence.csv à la ligne 0: age"):
+    import_personnes_sources(str(tmp_path / "*.csv"))
+  rejets = tmp_path / "rejets.csv"
+  consolide = import_personnes_sources([str(tmp_path / "*.csv"), str(tmp_path / "c_agence.txt")],
+                                       rejets=str(rejets))
+  assert "Xavier" in consolide["nom"].tolist() and "Yann" not in consolide["nom"].tolist()
+  ecartees = pd.read_csv(rejets)
+  assert ecartees[["nom", "ligne", "motif"]].values.tolist() == [["Yann", 0, "age: valeur invalide"]]
+  assert ecartees["fichier"].str.endswith("d_agence.csv").all()
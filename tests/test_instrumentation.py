@@ -0,0 +1,72 @@
+import json
+import pytest
+from src.account_module.core import export_suggestions_epargne, suggestion_epargne, suggestion_epargne_with_decorator
+from src.account_module.instrumentation import metriques, profilage, session_instrumentee
+from src.account_module.models.personne import Personne
+from src.account_module.models.epargne import Epargne
+
+@pytest.fixture(autouse=True)
+def reset_metriques():
+  metriques.reset()
+  yield
+  metriques.reset()
+
+@pytest.fixture
+def personne():
+  return Personne(nom="Alice", age=30, revenu_annuel=36000.0, loyer=800.0, depenses_mensuelles=500.0,
+                  objectif=30000.0, duree_epargne=5, versement_mensuel_utilisateur=200.0)
+
+@pytest.fixture
+def epargnes():
+  return [
+    Epargne(nom="Livret A", taux_interet=0.024, fiscalite=0.0, duree_min=0, versement_max=22950.0),
+    Epargne(nom="PEL", taux_interet=0.0175, fiscalite=0.3, duree_min=4, versement_max=61200.0),
+    Epargne(nom="Assurance Vie", taux_interet=0.025, fiscalite=0.172, duree_min=8, versement_max=150000.0),
+  ]
+
+def test_counters_by_skip_reason(personne, epargnes):
+  resultats = suggestion_epargne_with_decorator(personne, epargnes)
+  compteurs = metriques.to_dict()["compteurs"]
+  assert compteurs["produits_ignores.versement_max"] == 1
+  assert compteurs["produits_ignores.duree_min"] == 1
+  assert compteurs["scenarios_generes"] == len(resultats) == 5
+  assert compteurs["clients"] == 1
+  assert metriques.to_dict()["etapes"]["suggestion_epargne"]["appels"] == 1
+
+def test_chronometre_accumulates():
+  @metriques.chronometre("etape")
+  def f():
+    return 42
+  assert f() == 42 and f() == 42
+  assert metriques.appels["etape"] == 2
+  assert metriques.durees["etape"] >= 0
+
+def test_profilage_tracemalloc_records_peak():
+  with profilage("tracemalloc"):
+    _ = [0] * 100000
+  assert metriques.extras["tracemalloc"]["pic_octets"] > 0
+
+def test_profilage_unknown_mode():
+  with pytest.raises(ValueError):
+    with profilage("gprof"):
+      pass
+
+def test_session_dumps_json(tmp_path, monkeypatch, personne, epargnes):
+  fichier = tmp_path / "metrics.json"
+  monkeypatch.setenv("ACCOUNT_MODULE_METRICS", str(fichier))
+  with session_instrumentee():
+    suggestion_epargne(personne, epargnes)
+  data = json.loads(fichier.read_text())
+  assert data["compteurs"]["scenarios_generes"] == 5
+  assert "total" in data["etapes"]
+
+def test_parallel_export_merges_worker_counters(tmp_path):
+  personnes_file = "src/account_module/data/personnes.csv"
+  epargnes_file = "src/account_module/data/epargnes.csv"
+  lignes = export_suggestions_epargne(personnes_file, epargnes_file, str(tmp_path / "serie.csv"), chunksize=10)
+  serie = dict(metriques.compteurs)
+  metriques.reset()
+  export_suggestions_epargne(personnes_file, epargnes_file, str(tmp_path / "parallele.csv"), chunksize=10, workers=2)
+  assert dict(metriques.compteurs) == serie
+  assert serie["scenarios_generes"] == lignes
+  assert serie["lignes_lues.personnes"] == 30
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.account_module.core import suggestion_epargne, suggestion_epargne_resultats
+from src.account_module.models.epargne import Epargne
+from src.account_module.models.personne import Personne
+from src.account_module.montecarlo import SimulationMonteCarlo
+
+@pytest.fixture
+def epargnes():
+  return pd.DataFrame({
+    "nom": ["Livret A", "PEA"],
+    "taux_interet": [0.03, 0.06],
+    "fiscalite": [0.0, 0.172],
+    "duree_min": [0, 5],
+    "versement_max": [22950.0, 150000.0],
+    "volatilite": [0.0, 0.15],
+  })
+
+@pytest.fixture
+def personnes():
+  return pd.DataFrame({
+    "nom": ["A", "B"],
+    "age": [30, 45],
+    "revenu_annuel": [40000.0, 60000.0],
+    "loyer": [9000.0, 12000.0],
+    "depenses_mensuelles": [800.0, 1500.0],
+    "objectif": [20000.0, 80000.0],
+    "duree_epargne": [10, 8],
+    "versement_mensuel_utilisateur": [200.0, 0.0],
+  })
+
+def test_zero_volatility_matches_deterministic(epargnes, personnes):
+  simulation = SimulationMonteCarlo(epargnes, duree_max=10, chemins=100, seed=1)
+  resultats = suggestion_epargne_resultats(personnes, epargnes, monte_carlo=simulation)
+  df = resultats.to_dataframe(arrondi=False)
+  livret = df[df["nom_produit"] == "Livret A"]
+  for q in (5, 50, 95):
+    np.testing.assert_allclose(livret[f"montant_net_p{q}"], livret["montant_net_final"], rtol=1e-9)
+  np.testing.assert_array_equal(livret["proba_objectif"], livret["atteint_objectif"].astype(float))
+
+def test_seed_is_reproducible(epargnes):
+  a = SimulationMonteCarlo(epargnes, duree_max=5, chemins=200, seed=7)
+  b = SimulationMonteCarlo(epargnes, duree_max=5, chemins=200, seed=7)
+  np.testing.assert_array_equal(a.facteurs_tries, b.facteurs_tries)
+
+def test_probability_matches_path_count(epargnes):
+  simulation = SimulationMonteCarlo(epargnes, duree_max=8, chemins=1000, seed=3)
+  versement, objectif = 500.0, 60000.0
+  valeurs = simulation.indicateurs([1], [versement], [8], [objectif])
+  annuel = 12 * versement
+  net = annuel * 8 * 0.172 + annuel * 0.828 * simulation.facteurs_tries[1, 8]
+  assert valeurs["proba_objectif"][0] == pytest.approx(np.mean(net >= objectif))
+  assert 0.0 <= valeurs["proba_objectif"][0] <= 1.0
+  assert valeurs["montant_net_p5"][0] <= valeurs["montant_net_p50"][0] <= valeurs["montant_net_p95"][0]
+
+def test_too_long_duration_is_rejected(epargnes):
+  simulation = SimulationMonteCarlo(epargnes, duree_max=3, chemins=10, seed=0)
+  with pytest.raises(ValueError):
+    simulation.indicateurs([0], [100.0], [4], [1000.0])
+
+def test_scalar_matches_batch(epargnes, personnes):
+  simulation = SimulationMonteCarlo(epargnes, duree_max=10, chemins=500, seed=2)
+  batch = suggestion_epargne_resultats(personnes, epargnes, monte_carlo=simulation).to_dataframe(arrondi=False)
+  produits = [Epargne(r.nom, r.taux_interet, r.fiscalite, r.duree_min, r.versement_max, r.volatilite)
+              for r in epargnes.itertuples()]
+  for r in personnes.itertuples(index=False):
+    personne = Personne(**r._asdict())
+    scalaires = suggestion_epargne(personne, produits, monte_carlo=simulation)
+    lignes = batch[batch["nom_client"] == personne.nom]
+    assert len(scalaires) == len(lignes)
+    for resultat, (_, ligne) in zip(scalaires, lignes.iterrows()):
+      assert resultat.indicateurs["proba_objectif"] == pytest.approx(ligne["proba_objectif"])
+      assert resultat.indicateurs["montant_net_p50"] == pytest.approx(ligne["montant_net_p50"])
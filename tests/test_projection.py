@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.account_module.core import import_epargnes_dataframe, import_personnes_dataframe, suggestion_epargne_resultats
+from src.account_module.projection import ProjectionMensuelle, charger_courbes
+
+@pytest.fixture
+def epargnes():
+  return pd.DataFrame({
+    "nom": ["Livret A", "PEA"],
+    "taux_interet": [0.024, 0.06],
+    "fiscalite": [0.0, 0.172],
+    "duree_min": [0, 5],
+    "versement_max": [22950.0, 150000.0],
+  })
+
+def simulation(depots, taux_annuels):
+  montant = 0.0
+  for depot, t in zip(depots, taux_annuels):
+    montant = (montant + depot) * (1 + t) ** (1 / 12)
+  return montant
+
+def test_constant_rate_matches_monthly_loop(epargnes):
+  projection = ProjectionMensuelle(epargnes, horizon_mois=24)
+  result = projection.montant_final([0, 1], [100.0, 250.0], [24, 120])
+  assert result[0] == pytest.approx(simulation([100.0] * 24, [0.024] * 24), rel=1e-12)
+  assert result[1] == pytest.approx(simulation([250.0] * 120, [0.06] * 120), rel=1e-12)
+  assert projection.horizon_mois == 120
+
+def test_rate_curve_applies_piecewise(epargnes):
+  courbes = pd.DataFrame({"nom": ["Livret A", "Livret A"], "mois": [6, 0], "taux_interet": [0.017, 0.03]})
+  projection = ProjectionMensuelle(epargnes, horizon_mois=36, courbes=courbes)
+  taux = [0.03] * 6 + [0.017] * 30
+  assert projection.montant_final([0], [100.0], [36])[0] == pytest.approx(simulation([100.0] * 36, taux), rel=1e-12)
+  # Product without a curve keeps its constant rate
+  assert projection.taux_annuels[1].tolist() == [0.06] * 36
+
+def test_schedule_is_a_dot_product(epargnes):
+  projection = ProjectionMensuelle(epargnes, horizon_mois=12)
+  echeancier = np.array([[100.0] * 6 + [0.0] * 6, np.linspace(0, 110, 12)])
+  result = projection.montant_final_echeancier(0, echeancier)
+  for row, value in zip(echeancier, result):
+    assert value == pytest.approx(simulation(row, [0.024] * 12), rel=1e-12)
+
+def test_suggestions_with_monthly_projection():
+  epargnes_df = import_epargnes_dataframe("src/account_module/data/epargnes.csv")
+  personnes_df = import_personnes_dataframe("src/account_module/data/personnes.csv")
+  courbes = charger_courbes("src/account_module/data/taux.csv")
+  projection = ProjectionMensuelle(epargnes_df, horizon_mois=12, courbes=courbes)
+  annuel = suggestion_epargne_resultats(personnes_df, epargnes_df)
+  mensuel = suggestion_epargne_resultats(personnes_df, epargnes_df, projection=projection)
+  assert len(mensuel) == len(annuel)
+  np.testing.assert_array_equal(mensuel.total_versement, annuel.total_versement)
+  # Monthly deposits spend less time invested than annual ones paid up front
+  assert (mensuel.montant_net_final <= annuel.montant_net_final + 1e-9).all()
@@ -65,4 +65,72 @@ def test_to_dataframe_rounding():
   row = df.iloc[0]
   assert row['effort_mensuel'] == 100.00
   assert row['total_versement'] == 2000.00
-  assert row['montant_net_final'] == 3000.00
\ No newline at end of file
+  assert row['montant_net_final'] == 3000.00
+def make_resultats():
+  import numpy as np
+  from src.account_module.models.resultat import ResultatsEpargne
+  return ResultatsEpargne(
+    clients=np.array(["Alice", "Bob"], dtype=object),
+    produits=np.array(["Livret A", "PEL"], dtype=object),
+    indicateurs={"taux_interet": np.array([0.024, 0.0175]), "duree_min": np.array([0, 4])},
+    index_client=np.array([0, 0, 1]),
+    index_produit=np.array([0, 1, 1]),
+    scenarios=np.array([25.0, 25.0, 100.0]),
+    effort_mensuel=np.array([100.123, 100.123, 400.0]),
+    total_versement=np.array([1201.476, 1201.476, 4800.0]),
+    montant_net_final=np.array([1250.891, 1260.0, 5000.0]),
+    atteint_objectif=np.array([True, True, False]),
+  )
+
+def test_resultats_iterate_as_resultat_epargne():
+  resultats = make_resultats()
+  assert len(resultats) == 3
+  views = list(resultats)
+  assert all(isinstance(r, ResultatEpargne) for r in views)
+  assert views[2].nom_client == "Bob"
+  assert views[2].nom_produit == "PEL"
+  assert views[2].atteint_objectif is False
+  assert views[1].indicateurs == {"taux_interet": 0.0175, "duree_min": 4}
+
+def test_resultats_to_dataframe_matches_rows():
+  resultats = make_resultats()
+  df = resultats.to_dataframe()
+  expected = pd.concat([r.to_dataframe() for r in resultats], ignore_index=True)
+  pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+
+def test_resultats_to_dataframe_without_rounding_shares_arrays():
+  resultats = make_resultats()
+  df = resultats.to_dataframe(arrondi=False)
+  assert df['effort_mensuel'].iloc[0] == 100.123
+  assert df.shape == (3, 9)
+
+def test_meilleurs_keeps_best_scenario_per_product():
+  import pytest
+  resultats = make_resultats()
+  top = resultats.meilleurs(1)
+  assert [(r.nom_client, r.nom_produit, r.indicateurs["rang"]) for r in top] == [("Alice", "PEL", 1), ("Bob", "PEL", 1)]
+  # Bob does not reach his objective: no product by lowest effort
+  top = resultats.meilleurs(5, critere="effort_minimal")
+  assert [(r.nom_client, r.nom_produit, r.indicateurs["rang"]) for r in top] == [("Alice", "Livret A", 1), ("Alice", "PEL", 2)]
+  with pytest.raises(ValueError):
+    resultats.meilleurs(2, critere="inconnu")
+
+def test_meilleurs_matches_scalar_ranking():
+  import pytest
+  from src.account_module.core import (
+    import_epargnes, import_personnes, import_personnes_dataframe, import_epargnes_dataframe,
+    meilleures_suggestions, suggestion_epargne, suggestion_epargne_resultats
+  )
+  personnes_file = "src/account_module/data/personnes.csv"
+  epargnes_file = "src/account_module/data/epargnes.csv"
+  resultats = suggestion_epargne_resultats(import_personnes_dataframe(personnes_file), import_epargnes_dataframe(epargnes_file))
+  epargnes = import_epargnes(epargnes_file)
+  personnes = import_personnes(personnes_file)
+  for critere in ("gain_net", "effort_minimal", "efficacite_fiscale"):
+    top = resultats.meilleurs(3, critere=critere)
+    attendu = [r for p in personnes for r in meilleures_suggestions(suggestion_epargne(p, epargnes), 3, critere)]
+    assert len(top) == len(attendu)
+    assert max(top.indicateurs_lignes["rang"]) <= 3
+    for vue, r in zip(top, attendu):
+      assert (vue.nom_client, vue.nom_produit, vue.indicateurs["rang"]) == (r.nom_client, r.nom_produit, r.indicateurs["rang"])
+      assert vue.effort_mensuel == pytest.approx(r.effort_mensuel)
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.account_module.core import suggestion_epargne_batch
+from src.account_module.sensibilite import NIVEAUX_BALAYAGE, balayage_sensibilite
+
+@pytest.fixture
+def epargnes():
+  return pd.DataFrame({
+    "nom": ["Livret A", "PEL", "PEA"],
+    "taux_interet": [0.024, 0.0175, 0.06],
+    "fiscalite": [0.0, 0.3, 0.172],
+    "duree_min": [0, 4, 5],
+    "versement_max": [22950.0, 61200.0, None],
+  })
+
+@pytest.fixture
+def personnes():
+  return pd.DataFrame({
+    "nom": ["Alice", "Bob"],
+    "age": [30, 45],
+    "revenu_annuel": [36000.0, 60000.0],
+    "loyer": [800.0, 1200.0],
+    "depenses_mensuelles": [500.0, 1500.0],
+    "objectif": [20000.0, 80000.0],
+    "duree_epargne": [6, 10],
+    "versement_mensuel_utilisateur": [0.0, 0.0],
+  })
+
+def test_zero_shift_matches_full_capacity_scenario(personnes, epargnes):
+  balayage = balayage_sensibilite(personnes, epargnes)
+  assert list(balayage.index.names) == NIVEAUX_BALAYAGE
+  batch = suggestion_epargne_batch(personnes, epargnes)
+  attendu = batch[batch["scenarios"] == 100.0].set_index(["nom_client", "nom_produit"])
+  obtenu = balayage.droplevel(["delta_taux", "delta_fiscalite", "delta_duree", "effort"])
+  np.testing.assert_allclose(obtenu["montant_net_final"], attendu["montant_net_final"])
+  assert obtenu.index.tolist() == attendu.index.tolist()
+
+def test_grid_cells_match_edited_catalogue(personnes, epargnes):
+  balayage = balayage_sensibilite(personnes, epargnes, delta_taux=np.linspace(-0.01, 0.01, 5),
+                                  delta_fiscalite=[0.0, 0.1], delta_duree=[-5, 0, 3], efforts=[100.0, 250.0])
+  # A single cell equals a rerun with the edited inputs
+  modifies = epargnes.assign(taux_interet=epargnes["taux_interet"] - 0.005, fiscalite=epargnes["fiscalite"] + 0.1)
+  personnes_modifiees = personnes.assign(duree_epargne=personnes["duree_epargne"] + 3, versement_mensuel_utilisateur=250.0)
+  batch = suggestion_epargne_batch(personnes_modifiees, modifies)
+  attendu = batch.drop_duplicates(["nom_client", "nom_produit"]).set_index(["nom_client", "nom_produit"])
+  cellule = balayage.xs((-0.005, 0.1, 3, 250.0), level=["delta_taux", "delta_fiscalite", "delta_duree", "effort"])
+  np.testing.assert_allclose(cellule["montant_net_final"], attendu["montant_net_final"], atol=0.01)
+  assert cellule["atteint_objectif"].tolist() == attendu["atteint_objectif"].tolist()
+
+def test_shorter_duration_drops_ineligible_products(personnes, epargnes):
+  balayage = balayage_sensibilite(personnes, epargnes, delta_duree=[-2, 0])
+  alice = balayage.xs("Alice", level="nom_client")
+  # Alice saves 6 years: PEA (5 years minimum) only when the duration is not shortened
+  assert "PEA" not in alice.xs(-2, level="delta_duree").index.get_level_values("nom_produit")
+  assert "PEA" in alice.xs(0, level="delta_duree").index.get_level_values("nom_produit")
@@ -0,0 +1,71 @@
+import asyncio
+import json
+import pytest
+from src.account_module.core import import_epargnes, import_epargnes_dataframe, suggestion_epargne
+from src.account_module.instrumentation import metriques
+from src.account_module.models.personne import Personne
+from src.account_module.service import SuggestionService, serve
+
+EPARGNES = "src/account_module/data/epargnes.csv"
+
+def client(nom, objectif):
+  return {"nom": nom, "age": 30, "revenu_annuel": 36000.0, "loyer": 800.0, "depenses_mensuelles": 500.0,
+          "objectif": objectif, "duree_epargne": 10, "versement_mensuel_utilisateur": 200.0}
+
+async def requete(port, methode, chemin, donnees=None):
+  reader, writer = await asyncio.open_connection("127.0.0.1", port)
+  corps = json.dumps(donnees).encode() if donnees is not None else b""
+  writer.write(f"{methode} {chemin} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(corps)}\r\n\r\n".encode() + corps)
+  await writer.drain()
+  reponse = await reader.read()
+  writer.close()
+  entete, _, corps = reponse.partition(b"\r\n\r\n")
+  return int(entete.split()[1]), json.loads(corps)
+
+def test_service_micro_batches_concurrent_requests():
+  metriques.reset()
+  clients = [client(f"Client {i}", 5000.0 * (i + 1)) for i in range(20)]
+
+  async def scenario():
+    service = SuggestionService(import_epargnes_dataframe(EPARGNES), fenetre=0.05)
+    server = await serve(service, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+      sante = await requete(port, "GET", "/health")
+      reponses = await asyncio.gather(*(requete(port, "POST", "/suggestions", c) for c in clients))
+      return sante, reponses
+    finally:
+      server.close()
+      await server.wait_closed()
+      await service.stop()
+
+  sante, reponses = asyncio.run(scenario())
+  assert sante == (200, {"statut": "ok", "produits": 12})
+  epargnes = import_epargnes(EPARGNES)
+  for c, (statut, lignes) in zip(clients, reponses):
+    assert statut == 200
+    attendu = suggestion_epargne(Personne(**c), epargnes)
+    assert [(l["nom_client"], l["nom_produit"], l["atteint_objectif"]) for l in lignes] == \
+      [(r.nom_client, r.nom_produit, r.atteint_objectif) for r in attendu]
+    assert [l["montant_net_final"] for l in lignes] == pytest.approx([round(r.montant_net_final, 2) for r in attendu])
+  assert metriques.compteurs["service.requetes"] == 20
+  assert metriques.compteurs["service.lots"] < 20
+
+def test_service_rejects_invalid_client():
+  async def scenario():
+    service = SuggestionService(import_epargnes_dataframe(EPARGNES))
+    server = await serve(service, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+      incomplet = await requete(port, "POST", "/suggestions", {"nom": "Bob"})
+      inconnu = await requete(port, "GET", "/inconnu")
+      return incomplet, inconnu
+    finally:
+      server.close()
+      await server.wait_closed()
+      await service.stop()
+
+  incomplet, inconnu = asyncio.run(scenario())
+  assert incomplet[0] == 400
+  assert "revenu_annuel" in incomplet[1]["erreur"]
+  assert inconnu[0] == 404
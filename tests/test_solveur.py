@@ -0,0 +1,43 @@
+import math
+import pytest
+from src.account_module import utils
+from src.account_module.core import import_epargnes, import_personnes, suggestion_epargne
+from src.account_module.models.epargne import Epargne
+from src.account_module.models.personne import Personne
+from src.account_module.solveur import versement_minimal, versements_minimaux
+
+def montant_net(vm, epargne, duree):
+  versement_annuel = vm * 12
+  total = versement_annuel * duree
+  gain = utils.calcul_interets_composes(versement_annuel, epargne.taux_interet, duree) - total
+  return total + gain * (1 - epargne.fiscalite)
+
+@pytest.mark.parametrize("taux,fiscalite", [(0.0, 0.0), (0.024, 0.0), (0.0175, 0.3), (0.095, 0.3)])
+def test_versement_minimal_reaches_objectif_exactly(taux, fiscalite):
+  personne = Personne(nom="Alice", age=30, revenu_annuel=36000.0, loyer=800.0, depenses_mensuelles=500.0,
+                      objectif=50000.0, duree_epargne=12)
+  epargne = Epargne(nom="P", taux_interet=taux, fiscalite=fiscalite, duree_min=0)
+  vm = versement_minimal(personne, epargne)
+  assert montant_net(vm, epargne, personne.duree_epargne) == pytest.approx(50000.0, rel=1e-12)
+
+def test_versement_minimal_zero_duration():
+  personne = Personne(nom="Bob", age=30, revenu_annuel=36000.0, loyer=800.0, depenses_mensuelles=500.0,
+                      objectif=1000.0, duree_epargne=0)
+  assert math.isinf(versement_minimal(personne, Epargne(nom="P", taux_interet=0.02, fiscalite=0.0, duree_min=0)))
+
+def test_versements_minimaux_vectorized_matches_products():
+  personnes = import_personnes("src/account_module/data/personnes.csv")
+  epargnes = import_epargnes("src/account_module/data/epargnes.csv")
+  df = versements_minimaux(personnes, epargnes)
+  par_nom = {e.nom: e for e in epargnes}
+
+  # Same (client, product) pairs as suggestion_epargne
+  attendu = [(r.nom_client, r.nom_produit) for p in personnes for r in suggestion_epargne(p, epargnes)]
+  assert list(zip(df["nom_client"], df["nom_produit"])) == list(dict.fromkeys(attendu))
+
+  duree = {p.nom: p.duree_epargne for p in personnes}
+  objectif = {p.nom: p.objectif for p in personnes}
+  for row in df.itertuples():
+    e = par_nom[row.nom_produit]
+    assert montant_net(row.versement_mensuel_minimal, e, duree[row.nom_client]) >= objectif[row.nom_client]
+    assert montant_net(row.versement_mensuel_minimal - 0.01, e, duree[row.nom_client]) < objectif[row.nom_client]
@@ -0,0 +1,55 @@
+import sqlite3
+import pandas as pd
+import pytest
+from src.account_module.core import export_suggestions_epargne
+from src.account_module.stockage import ResultatsSQLite
+
+PERSONNES = "src/account_module/data/personnes.csv"
+EPARGNES = "src/account_module/data/epargnes.csv"
+
+@pytest.fixture
+def exports(tmp_path):
+  csv = tmp_path / "suggestions.csv"
+  base = tmp_path / "suggestions.sqlite"
+  export_suggestions_epargne(PERSONNES, EPARGNES, str(csv), chunksize=7)
+  lignes = export_suggestions_epargne(PERSONNES, EPARGNES, str(base), chunksize=7)
+  return pd.read_csv(csv), str(base), lignes
+
+def test_store_round_trips_the_export(exports):
+  attendu, base, lignes = exports
+  assert lignes == len(attendu)
+  with ResultatsSQLite(base) as store:
+    pd.testing.assert_frame_equal(store.resultats(), attendu, check_dtype=False)
+    alice = store.resultats_client("Alice")
+  pd.testing.assert_frame_equal(alice, attendu[attendu["nom_client"] == "Alice"].reset_index(drop=True), check_dtype=False)
+
+def test_products_are_normalized_and_lookups_indexed(exports):
+  attendu, base, _ = exports
+  connexion = sqlite3.connect(base)
+  assert connexion.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+  assert connexion.execute("SELECT COUNT(*) FROM produits").fetchone()[0] == attendu["nom_produit"].nunique()
+  colonnes = [ligne[1] for ligne in connexion.execute("PRAGMA table_info(suggestions)")]
+  assert "taux_interet" not in colonnes
+  plan = " ".join(str(ligne) for ligne in connexion.execute(
+    "EXPLAIN QUERY PLAN SELECT * FROM suggestions WHERE nom_client = ?", ("Alice",)))
+  assert "idx_suggestions_client" in plan
+  connexion.close()
+
+def test_clients_reaching_objective_with_product(exports):
+  attendu, base, _ = exports
+  with ResultatsSQLite(base) as store:
+    for produit in ["LEP", "Livret A"]:
+      lignes = attendu[(attendu["nom_produit"] == produit) & attendu["atteint_objectif"]]
+      assert store.clients_atteignant(produit) == list(dict.fromkeys(lignes["nom_client"]))
+      filtre = store.resultats(nom_produit=produit, atteint_objectif=True)
+      assert len(filtre) == len(lignes)
+
+def test_extra_columns_and_appends(tmp_path):
+  from src.account_module.core import import_epargnes_dataframe, import_personnes_dataframe, suggestion_epargne_batch
+  top = suggestion_epargne_batch(import_personnes_dataframe(PERSONNES), import_epargnes_dataframe(EPARGNES), top_k=2)
+  base = str(tmp_path / "top.db")
+  with ResultatsSQLite(base, taille_lot=5) as store:
+    store.write(top.iloc[:10])
+    store.write(top.iloc[10:])
+  with ResultatsSQLite(base) as store:
+    pd.testing.assert_frame_equal(store.resultats(), top, check_dtype=False)
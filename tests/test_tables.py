@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.account_module.models.personne import Personne
+from src.account_module.models.epargne import Epargne
+from src.account_module.models.tables import PersonneTable, EpargneTable
+
+def make_personnes():
+  return [
+    Personne(nom="Alice", age=30, revenu_annuel=36000.0, loyer=800.0, depenses_mensuelles=500.0,
+             objectif=10000.0, duree_epargne=5, versement_mensuel_utilisateur=200.0),
+    Personne(nom="Bob", age=40, revenu_annuel=48000.0, loyer=1000.0, depenses_mensuelles=700.0,
+             objectif=20000.0, duree_epargne=10),
+  ]
+
+def test_models_use_slots():
+  personne = make_personnes()[0]
+  epargne = Epargne(nom="Livret A", taux_interet=0.024, fiscalite=0.0, duree_min=0)
+  assert not hasattr(personne, "__dict__")
+  assert not hasattr(epargne, "__dict__")
+
+def test_personne_table_capacite_matches_scalar():
+  personnes = make_personnes()
+  table = PersonneTable.from_personnes(personnes)
+  assert len(table) == 2
+  np.testing.assert_array_equal(table.calcul_capacite_epargne(), [p.calcul_capacite_epargne() for p in personnes])
+
+def test_personne_table_dataframe_round_trip():
+  personnes = make_personnes()
+  df = PersonneTable.from_personnes(personnes).to_dataframe()
+  assert list(df.columns) == ["nom", "age", "revenu_annuel", "loyer", "depenses_mensuelles",
+                              "objectif", "duree_epargne", "versement_mensuel_utilisateur"]
+  for view, p in zip(PersonneTable.from_dataframe(df), personnes):
+    for attr in Personne.__slots__:
+      assert getattr(view, attr) == getattr(p, attr)
+
+def test_personne_table_missing_versement_is_zero():
+  df = pd.DataFrame({"nom": ["Claire"], "age": [28], "revenu_annuel": [28000.0], "loyer": [750.0],
+                     "depenses_mensuelles": [700.0], "objectif": [1000.0], "duree_epargne": [6],
+                     "versement_mensuel_utilisateur": [None]})
+  assert PersonneTable.from_dataframe(df).versement_mensuel_utilisateur[0] == 0.0
+
+def test_epargne_table_round_trip():
+  epargnes = [
+    Epargne(nom="Livret A", taux_interet=0.024, fiscalite=0.0, duree_min=0, versement_max=22950.0),
+    Epargne(nom="SCPI", taux_interet=0.071, fiscalite=0.3, duree_min=5),
+  ]
+  table = EpargneTable.from_epargnes(epargnes)
+  df = table.to_dataframe()
+  assert list(df.columns) == ["nom", "taux_interet", "fiscalite", "duree_min", "versement_max", "volatilite"]
+  assert [repr(e) for e in EpargneTable.from_dataframe(df)] == [repr(e) for e in epargnes]
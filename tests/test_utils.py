@@ -0,0 +1,165 @@
+import numpy as np
+import pytest
+from src.account_module.utils import (
+  calcul_interets_composes,
+  calcul_interets_composes_vectorise,
+  TableFacteurs,
+)
+
+def reference_loop(versement_annuel, taux_annuel, duree_annees):
+  montant_final = 0.0
+  for _ in range(duree_annees):
+    montant_final = (montant_final + versement_annuel) * (1 + taux_annuel)
+  return montant_final
+
+@pytest.mark.parametrize("taux", [0.0, 0.0175, 0.024, 0.095, -0.01])
+@pytest.mark.parametrize("duree", [0, 1, 6, 40])
+def test_calcul_interets_composes_matches_loop(taux, duree):
+  assert calcul_interets_composes(1200.0, taux, duree) == pytest.approx(reference_loop(1200.0, taux, duree), rel=1e-12)
+
+def test_calcul_interets_composes_zero_rate():
+  assert calcul_interets_composes(1000.0, 0.0, 10) == 10000.0
+
+def test_calcul_interets_composes_negative_duration():
+  assert calcul_interets_composes(1000.0, 0.03, -2) == 0.0
+
+def test_calcul_interets_composes_vectorise_broadcasts():
+  versements = np.array([1200.0, 2400.0])[:, None]
+  taux = np.array([0.0, 0.024, 0.08])
+  result = calcul_interets_composes_vectorise(versements, taux, 10)
+  assert result.shape == (2, 3)
+  for i, v in enumerate([1200.0, 2400.0]):
+    for j, t in enumerate(taux):
+      assert result[i, j] == pytest.approx(reference_loop(v, t, 10), rel=1e-12)
+
+def test_table_facteurs_lookup():
+  table = TableFacteurs([0.024, 0.0, 0.024, 0.035], duree_max=20)
+  assert len(table.taux_annuels) == 3
+  assert table[0.0, 7] == 7.0
+  assert table[0.035, 20] * 1200 == pytest.approx(reference_loop(1200.0, 0.035, 20), rel=1e-12)
+  facteurs = table.facteurs(np.array([0.024, 0.035]), np.array([3, 0]))
+  assert facteurs[1] == 0.0
+
+def test_table_facteurs_unknown_key():
+  table = TableFacteurs([0.024], duree_max=5)
+  with pytest.raises(KeyError):
+    table[0.05, 1]
+  with pytest.raises(ValueError):
+    table[0.024, 6]
+
+@pytest.mark.parametrize("extension", [".parquet", ".feather"])
+def test_binary_formats_keep_dtypes(tmp_path, extension):
+  pytest.importorskip("pyarrow")
+  import pandas as pd
+  from src.account_module.utils import clean_dataframe, read_dataframe, write_dataframe
+  df = clean_dataframe(pd.DataFrame({"nom": ["A", "B"], "age": ["30", None], "loyer": ["800.5", "None"]}),
+                       float_cols=["loyer"], int_cols=["age"])
+  fichier = str(tmp_path / f"personnes{extension}")
+  write_dataframe(df, fichier)
+  relu = read_dataframe(fichier)
+  assert str(relu["age"].dtype) == "Int64"
+  pd.testing.assert_frame_equal(relu, df, check_dtype=False)
+
+def test_read_cached_dataframe_invalidation(tmp_path, monkeypatch):
+  pytest.importorskip("pyarrow")
+  import os
+  from src.account_module import utils
+  source = tmp_path / "epargnes.csv"
+  source.write_text("nom,taux_interet,duree_min\nLivret A,0.024,0\n")
+  cache = str(tmp_path / "epargnes.parquet")
+  lectures = []
+  read_dataframe = utils.read_dataframe
+  monkeypatch.setattr(utils, "read_dataframe", lambda f: lectures.append(os.path.basename(f)) or read_dataframe(f))
+
+  def charger():
+    return utils.read_cached_dataframe(str(source), cache, float_cols=["taux_interet"], int_cols=["duree_min"])
+
+  assert charger()["taux_interet"].tolist() == [0.024]
+  assert charger()["duree_min"].dtype.name == "Int64"
+  # Same content with a new mtime: cache kept
+  os.utime(source, ns=(0, 10**9))
+  charger()
+  # Content change: cache rebuilt
+  source.write_text("nom,taux_interet,duree_min\nLivret A,0.03,0\n")
+  assert charger()["taux_interet"].tolist() == [0.03]
+  assert lectures == ["epargnes.csv", "epargnes.parquet", "epargnes.parquet", "epargnes.csv"]
+
+def test_valider_dataframe_rejects_rows_with_reasons():
+  import pandas as pd
+  from src.account_module.utils import valider_dataframe
+  df = pd.DataFrame({
+    "nom": ["A", "B", "C", "D"],
+    "age": ["30", "x", "41.5", None],
+    "loyer": ["800.5", "None", "abc", "12"],
+  })
+  valides, rejets = valider_dataframe(df, float_cols=["loyer"], int_cols=["age"], requis=["age"])
+  assert valides["nom"].tolist() == ["A"]
+  assert str(valides["age"].dtype) == "Int64"
+  assert rejets["ligne"].tolist() == [1, 2, 3]
+  assert rejets["age"].tolist()[:2] == ["x", "41.5"]
+  assert rejets["motif"].tolist() == [
+    "age: valeur invalide",
+    "loyer: valeur invalide; age: valeur invalide",
+    "age: valeur manquante",
+  ]
+
+def test_clean_dataframe_raises_or_writes_rejects(tmp_path):
+  import pandas as pd
+  from src.account_module.utils import clean_dataframe
+  df = pd.DataFrame({"nom": ["A", "B"], "loyer": ["800", "huit cents"]})
+  with pytest.raises(ValueError, match="ligne 1: loyer"):
+    clean_dataframe(df, float_cols=["loyer"], int_cols=[])
+  fichier = tmp_path / "rejets.csv"
+  propre = clean_dataframe(df, float_cols=["loyer"], int_cols=[], rejets=str(fichier))
+  assert propre["loyer"].tolist() == [800.0]
+  assert pd.read_csv(fichier)["motif"].tolist() == ["loyer: valeur invalide"]
+
+def test_excel_streaming_round_trip(tmp_path, monkeypatch):
+  pytest.importorskip("openpyxl")
+  import pandas as pd
+  from src.account_module import utils
+  df = pd.DataFrame({
+    "nom": ["A", "B", "C", "D", "E"],
+    "age": pd.array([30, None, 41, 25, 60], dtype="Int64"),
+    "loyer": [800.5, 900.0, None, 700.0, 650.0],
+    "commentaire": ["x", "y", "z", "t", "u"],
+  })
+  fichier = str(tmp_path / "personnes.xlsx")
+  # Two rows per sheet: the writer rolls over to new sheets
+  monkeypatch.setattr(utils.DataFrameWriter, "LIGNES_MAX_EXCEL", 2)
+  with utils.DataFrameWriter(fichier) as writer:
+    writer.write(df.iloc[:3])
+    writer.write(df.iloc[3:])
+  assert writer.lignes == 5
+
+  from openpyxl import load_workbook
+  assert load_workbook(fichier, read_only=True).sheetnames == ["Feuille1", "Feuille2", "Feuille3"]
+
+  chunks = list(utils.iter_excel(fichier, chunksize=2, colonnes=["nom", "age", "loyer"]))
+  assert [len(c) for c in chunks] == [2, 2, 1]
+  assert chunks[-1].index.tolist() == [4]
+  relu = utils.read_dataframe(fichier, colonnes=["nom", "age", "loyer"])
+  assert list(relu.columns) == ["nom", "age", "loyer"]
+  propre = utils.clean_dataframe(relu, float_cols=["loyer"], int_cols=["age"])
+  pd.testing.assert_frame_equal(propre, df[["nom", "age", "loyer"]], check_dtype=False)
+  assert list(utils.iter_excel(fichier, feuilles=["Feuille3"]))[0]["nom"].tolist() == ["E"]
+
+def test_lister_fichiers_and_separateur_csv(tmp_path):
+  from src.account_module import utils
+
+  (tmp_path / "a.csv").write_text("nom;age\nA;30\n")
+  (tmp_path / "b.txt").write_text("nom\tage\nB;x\t40\n")
+  (tmp_path / "notes.md").write_text("pas des données")
+  (tmp_path / "sous").mkdir()
+  (tmp_path / "sous" / "c.csv").write_text("nom,age\nC,50\n")
+
+  attendu = [str(tmp_path / "a.csv"), str(tmp_path / "b.txt")]
+  assert utils.lister_fichiers(str(tmp_path)) == attendu
+  assert utils.lister_fichiers(str(tmp_path / "*.csv")) == attendu[:1]
+  assert utils.lister_fichiers([str(tmp_path / "b.txt"), str(tmp_path)]) == attendu
+  with pytest.raises(FileNotFoundError):
+    utils.lister_fichiers(str(tmp_path / "*.xlsx"))
+
+  assert utils.separateur_csv(str(tmp_path / "a.csv")) == ";"
+  assert utils.separateur_csv(str(tmp_path / "b.txt")) == "\t"
+  assert utils.read_dataframe(str(tmp_path / "a.csv"))["age"].tolist() == [30]